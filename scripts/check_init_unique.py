@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Guard against duplicated or drifting package __init__ modules.
+
+Fails (exit status 1) if, under src/pluggedinkit:
+
+- a package directory contains stray copies of its __init__ module
+  (e.g. ``__init__ 2.py`` or ``__init__.py.orig``),
+- two __init__.py files have identical contents, or
+- an __init__.py that resolves exports lazily has an ``__all__`` that does not
+  match the keys of its ``_LAZY`` map.
+
+Usage: python scripts/check_init_unique.py
+"""
+
+import ast
+import hashlib
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "src" / "pluggedinkit"
+
+
+def _literal_names(tree: ast.Module, target: str) -> Optional[Set[str]]:
+    """Return the string entries of a module-level list/dict literal assigned to target."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if not any(isinstance(t, ast.Name) and t.id == target for t in targets):
+            continue
+        value = node.value
+        if isinstance(value, ast.Dict):
+            elements = value.keys
+        elif isinstance(value, (ast.List, ast.Tuple)):
+            elements = value.elts
+        else:
+            return None
+        return {e.value for e in elements if isinstance(e, ast.Constant)}
+    return None
+
+
+def check(package: Path) -> List[str]:
+    errors: List[str] = []
+    digests: Dict[str, Path] = {}
+
+    for directory in sorted(p for p in package.rglob("*") if p.is_dir()):
+        if directory.name == "__pycache__":
+            continue
+        strays = sorted(
+            p.name
+            for p in directory.iterdir()
+            if p.is_file() and p.name.startswith("__init__") and p.name != "__init__.py"
+        )
+        if strays:
+            errors.append(f"{directory.relative_to(ROOT)}: stray __init__ copies {strays}")
+
+    for init in sorted(package.rglob("__init__.py")):
+        relative = init.relative_to(ROOT)
+        source = init.read_bytes()
+
+        digest = hashlib.sha1(source).hexdigest()
+        if digest in digests:
+            errors.append(f"{relative}: identical to {digests[digest].relative_to(ROOT)}")
+        else:
+            digests[digest] = init
+
+        tree = ast.parse(source, filename=str(relative))
+        lazy = _literal_names(tree, "_LAZY")
+        exported = _literal_names(tree, "__all__")
+        if lazy is not None and exported is not None and lazy != exported:
+            missing = sorted(exported - lazy)
+            extra = sorted(lazy - exported)
+            errors.append(
+                f"{relative}: __all__ and _LAZY differ "
+                f"(missing from _LAZY: {missing}, not in __all__: {extra})"
+            )
+
+    return errors
+
+
+def main() -> int:
+    errors = check(PACKAGE)
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Optional compiled build for pluggedinkit
+
+Package metadata lives in pyproject.toml. By default this builds the usual
+pure-Python wheel; with ``PLUGGEDINKIT_COMPILE`` set at build time the hot
+helper modules listed below are compiled as well. The ``.py`` sources stay in
+the wheel, so a failed or skipped compile only costs speed.
+
+    PLUGGEDINKIT_COMPILE=1 pip wheel . --no-build-isolation      # Cython
+    PLUGGEDINKIT_COMPILE=mypyc pip wheel . --no-build-isolation
+
+Neither Cython nor mypyc is a build requirement, so install Cython (or mypy)
+into the build environment first. cibuildwheel does this itself; see
+[tool.cibuildwheel] in pyproject.toml.
+"""
+
+import os
+
+from setuptools import setup
+
+COMPILED_MODULES = [
+    "src/pluggedinkit/services/_clipboard_helpers.py",
+    "src/pluggedinkit/services/_rag_helpers.py",
+]
+
+
+def _ext_modules():
+    backend = os.environ.get("PLUGGEDINKIT_COMPILE")
+    if backend == "mypyc":
+        from mypyc.build import mypycify
+
+        # Only the compiled modules must type-check; modules they import are
+        # analysed but not reported on
+        return mypycify(["--follow-imports=silent", *COMPILED_MODULES], opt_level="3")
+    if backend not in ("1", "cython"):
+        return []
+
+    from Cython.Build import cythonize
+
+    return cythonize(COMPILED_MODULES, compiler_directives={"language_level": "3"})
+
+
+setup(ext_modules=_ext_modules())
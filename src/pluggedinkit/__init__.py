@@ -2,105 +2,185 @@
 Plugged.in Library SDK for Python
 
 Official SDK for interacting with Plugged.in's document library and RAG capabilities.
+
+Public names are resolved lazily on first attribute access, so ``import pluggedinkit``
+does not pull in the HTTP client stack until it is actually used. Set
+``PLUGGEDINKIT_EAGER_IMPORT=1`` to resolve everything at import time instead, e.g. to
+surface missing dependencies in CI or to pre-warm serverless instances.
 """
 
-__version__ = "1.0.0"
+import importlib
+import os
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ._version import __version__ as __version__
+
+if TYPE_CHECKING:
+    from .client import AsyncPluggedInClient, PluggedInClient
+    from .exceptions import (
+        AuthenticationError,
+        NotFoundError,
+        PluggedInError,
+        RateLimitError,
+        ValidationError,
+    )
+    from .services.agents import (
+        Agent,
+        AgentDetails,
+        AgentService,
+        AsyncAgentService,
+        AsyncHeartbeatBatcher,
+        CreateAgentRequest,
+        Heartbeat,
+        HeartbeatBatcher,
+        LifecycleEvent,
+        Metrics,
+        ResourceRequirements,
+    )
+    from .services.clipboard import ClearAllResult
+    from .types import (
+        DEFAULT_CLIPBOARD_SOURCE,
+        AIMetadata,
+        ClipboardDeleteRequest,
+        ClipboardDeleteResponse,
+        ClipboardEncoding,
+        ClipboardEntry,
+        ClipboardGetFilters,
+        ClipboardListResponse,
+        ClipboardPushRequest,
+        ClipboardResponse,
+        ClipboardSetRequest,
+        ClipboardSource,
+        ClipboardVisibility,
+        Document,
+        DocumentFilters,
+        DocumentListResponse,
+        DocumentWithContent,
+        ModelInfo,
+        RagResponse,
+        RagSourceDocument,
+        RagStorageStats,
+        SearchResponse,
+        SearchResult,
+        UpdateDocumentRequest,
+        UploadMetadata,
+        UploadResponse,
+    )
 
-from .client import PluggedInClient, AsyncPluggedInClient
-from .exceptions import (
-    PluggedInError,
-    AuthenticationError,
-    RateLimitError,
-    NotFoundError,
-    ValidationError,
-)
-from .services.clipboard import ClearAllResult
-from .types import (
-    # Clipboard types
-    ClipboardEntry,
-    ClipboardListResponse,
-    ClipboardSetRequest,
-    ClipboardPushRequest,
-    ClipboardGetFilters,
-    ClipboardDeleteRequest,
-    ClipboardResponse,
-    ClipboardDeleteResponse,
-    ClipboardEncoding,
-    ClipboardVisibility,
-    ClipboardSource,
-    DEFAULT_CLIPBOARD_SOURCE,
-    # Document types
-    Document,
-    DocumentWithContent,
-    DocumentListResponse,
-    DocumentFilters,
-    SearchResponse,
-    SearchResult,
-    UpdateDocumentRequest,
-    UploadMetadata,
-    UploadResponse,
-    RagResponse,
-    RagSourceDocument,
-    RagStorageStats,
-    ModelInfo,
-    AIMetadata,
-)
-from .services.agents import (
-    Agent,
-    CreateAgentRequest,
-    ResourceRequirements,
-    Heartbeat,
-    Metrics,
-    LifecycleEvent,
-    AgentDetails,
-    AgentService,
-    AsyncAgentService,
-)
+# Maps each public name to the submodule that defines it
+_LAZY: Dict[str, str] = {
+    "PluggedInClient": ".client",
+    "AsyncPluggedInClient": ".client",
+    "PluggedInError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "ClearAllResult": ".services.clipboard",
+    "ClipboardEntry": ".types",
+    "ClipboardListResponse": ".types",
+    "ClipboardSetRequest": ".types",
+    "ClipboardPushRequest": ".types",
+    "ClipboardGetFilters": ".types",
+    "ClipboardDeleteRequest": ".types",
+    "ClipboardResponse": ".types",
+    "ClipboardDeleteResponse": ".types",
+    "ClipboardEncoding": ".types",
+    "ClipboardVisibility": ".types",
+    "ClipboardSource": ".types",
+    "DEFAULT_CLIPBOARD_SOURCE": ".types",
+    "Document": ".types",
+    "DocumentWithContent": ".types",
+    "DocumentListResponse": ".types",
+    "DocumentFilters": ".types",
+    "SearchResponse": ".types",
+    "SearchResult": ".types",
+    "UpdateDocumentRequest": ".types",
+    "UploadMetadata": ".types",
+    "UploadResponse": ".types",
+    "RagResponse": ".types",
+    "RagSourceDocument": ".types",
+    "RagStorageStats": ".types",
+    "ModelInfo": ".types",
+    "AIMetadata": ".types",
+    # Agent types
+    "Agent": ".services.agents",
+    "CreateAgentRequest": ".services.agents",
+    "ResourceRequirements": ".services.agents",
+    "Heartbeat": ".services.agents",
+    "Metrics": ".services.agents",
+    "LifecycleEvent": ".services.agents",
+    "AgentDetails": ".services.agents",
+    "AgentService": ".services.agents",
+    "AsyncAgentService": ".services.agents",
+    "HeartbeatBatcher": ".services.agents",
+    "AsyncHeartbeatBatcher": ".services.agents",
+}
 
 __all__ = [
-    "PluggedInClient",
+    "DEFAULT_CLIPBOARD_SOURCE",
+    "AIMetadata",
+    "Agent",
+    "AgentDetails",
+    "AgentService",
+    "AsyncAgentService",
+    "AsyncHeartbeatBatcher",
     "AsyncPluggedInClient",
-    "PluggedInError",
     "AuthenticationError",
-    "RateLimitError",
-    "NotFoundError",
-    "ValidationError",
-    # Clipboard types
+    "ClearAllResult",
+    "ClipboardDeleteRequest",
+    "ClipboardDeleteResponse",
+    "ClipboardEncoding",
     "ClipboardEntry",
+    "ClipboardGetFilters",
     "ClipboardListResponse",
-    "ClipboardSetRequest",
     "ClipboardPushRequest",
-    "ClipboardGetFilters",
-    "ClipboardDeleteRequest",
     "ClipboardResponse",
-    "ClipboardDeleteResponse",
-    "ClipboardEncoding",
-    "ClipboardVisibility",
+    "ClipboardSetRequest",
     "ClipboardSource",
-    "ClearAllResult",
-    "DEFAULT_CLIPBOARD_SOURCE",
-    # Document types
+    "ClipboardVisibility",
+    "CreateAgentRequest",
     "Document",
-    "DocumentWithContent",
-    "DocumentListResponse",
     "DocumentFilters",
+    "DocumentListResponse",
+    "DocumentWithContent",
+    "Heartbeat",
+    "HeartbeatBatcher",
+    "LifecycleEvent",
+    "Metrics",
+    "ModelInfo",
+    "NotFoundError",
+    "PluggedInClient",
+    "PluggedInError",
+    "RagResponse",
+    "RagSourceDocument",
+    "RagStorageStats",
+    "RateLimitError",
+    "ResourceRequirements",
     "SearchResponse",
     "SearchResult",
     "UpdateDocumentRequest",
     "UploadMetadata",
     "UploadResponse",
-    "RagResponse",
-    "RagSourceDocument",
-    "RagStorageStats",
-    "ModelInfo",
-    "AIMetadata",
-    "Agent",
-    "CreateAgentRequest",
-    "ResourceRequirements",
-    "Heartbeat",
-    "Metrics",
-    "LifecycleEvent",
-    "AgentDetails",
-    "AgentService",
-    "AsyncAgentService",
+    "ValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the module so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if os.environ.get("PLUGGEDINKIT_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,93 @@
+"""Coalescing of concurrent single-item calls into batch requests
+
+AsyncBatcher collects items submitted by concurrent coroutines for a short
+window (or until a size cap is reached) and hands them to a batch function in
+one call, resolving each submitter with its own result.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Set, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_DELAY = 0.005
+DEFAULT_MAX_BATCH = 64
+
+
+class AsyncBatcher(Generic[T, R]):
+    """Merge items submitted within ``max_delay`` seconds into one batch call.
+
+    ``flush`` receives the items in submission order and must return one result
+    per item, in the same order. If it raises, every submitter in that batch
+    receives the exception; to fail a single item instead, return an
+    exception instance in its place.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[Sequence[Union[R, BaseException]]]],
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self._flush = flush
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._items: List[T] = []
+        self._futures: List[asyncio.Future[R]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Strong references so in-flight batches are not garbage collected
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item for the current batch and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+
+        if len(self._items) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        if not items:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(items, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, items: List[T], futures: List["asyncio.Future[R]"]) -> None:
+        try:
+            results = await self._flush(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch returned {len(results)} results for {len(items)} items"
+                )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,194 @@
+"""In-process caching of read-mostly API results
+
+TTLCache is a small LRU map whose entries expire a fixed number of seconds
+after they are stored. Services use it for opt-in caching of lookups that are
+repeated far more often than the underlying data changes.
+
+SemanticCache matches free-text keys by embedding similarity instead of
+equality, so paraphrased questions can share one answer. It needs numpy
+(``pip install pluggedinkit[semantic]``) and a caller-supplied embedding
+function.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from ._lazy import is_available, lazy_import
+
+_np = lazy_import("numpy")
+
+V = TypeVar("V")
+
+DEFAULT_MAXSIZE = 256
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_SEMANTIC_CAPACITY = 1024
+
+
+class TTLCache(Generic[V]):
+    """LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    Safe to share between threads. ``None`` is never stored, so get()
+    returning None always means a miss.
+    """
+
+    __slots__ = ("_data", "_lock", "maxsize", "ttl")
+
+    def __init__(self, ttl: float, maxsize: int = DEFAULT_MAXSIZE):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        if value is None:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop the entry for key, if any"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache(Generic[V]):
+    """Cache keyed by text, matched by cosine similarity of embeddings.
+
+    ``embed_fn`` maps a text to a 1-D vector (any sequence or numpy array of
+    floats); it is called synchronously once per lookup, so keep it local and
+    cheap. A lookup returns the value stored for the most similar earlier
+    text if the similarity is at least ``threshold``. Embeddings are kept
+    normalized in one preallocated float32 matrix, so a lookup is a single
+    matrix-vector product. When ``capacity`` is reached the oldest entries
+    are overwritten.
+
+    Use lookup() and add() together to embed each text only once:
+
+        value, vector = cache.lookup(text)
+        if value is None:
+            value = compute(text)
+            cache.add(vector, value)
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Any],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        capacity: int = DEFAULT_SEMANTIC_CAPACITY,
+        ttl: Optional[float] = None,
+    ):
+        if not is_available("numpy"):
+            raise ImportError(
+                "SemanticCache requires numpy; install it with "
+                "'pip install pluggedinkit[semantic]'"
+            )
+        if not -1.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between -1 and 1")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive when provided")
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.capacity = capacity
+        self.ttl = ttl
+        # Allocated on the first add(), once the embedding dimension is known
+        self._matrix: Any = None
+        self._values: List[Optional[V]] = [None] * capacity
+        # Expiry time of each row (monotonic clock), only used with a ttl
+        self._expires: Any = _np.zeros(capacity) if ttl is not None else None
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> Any:
+        """Return the normalized float32 embedding of text"""
+        vector = _np.asarray(self.embed_fn(text), dtype=_np.float32).reshape(-1)
+        norm = float(_np.linalg.norm(vector))
+        # A zero vector stays zero and so never matches anything
+        return vector / norm if norm else vector
+
+    def lookup(self, text: str) -> Tuple[Optional[V], Any]:
+        """Return the best match for text (or None) and the text's embedding"""
+        vector = self.embed(text)
+        with self._lock:
+            if not self._size:
+                return None, vector
+            scores = self._matrix[: self._size] @ vector
+            if self._expires is not None:
+                expired = self._expires[: self._size] <= time.monotonic()
+                if expired.any():
+                    # Keep expired rows out of the match and release their values
+                    scores[expired] = -_np.inf
+                    for row in _np.flatnonzero(expired):
+                        self._values[row] = None
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None, vector
+            return self._values[best], vector
+
+    def get(self, text: str) -> Optional[V]:
+        """Return the value stored for the most similar text, or None"""
+        return self.lookup(text)[0]
+
+    def add(self, vector: Any, value: V) -> None:
+        """Store value under an embedding returned by embed() or lookup()"""
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = _np.zeros((self.capacity, vector.shape[0]), dtype=_np.float32)
+            elif vector.shape[0] != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Embedding has dimension {vector.shape[0]}, "
+                    f"expected {self._matrix.shape[1]}"
+                )
+            row = self._next
+            self._matrix[row] = vector
+            self._values[row] = value
+            if self.ttl is not None:
+                self._expires[row] = time.monotonic() + self.ttl
+            self._next = (row + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def set(self, text: str, value: V) -> None:
+        """Embed text and store value under it"""
+        self.add(self.embed(text), value)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._values = [None] * self.capacity
+            self._size = 0
+            self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
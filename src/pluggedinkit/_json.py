@@ -0,0 +1,181 @@
+"""JSON encoding and decoding for API requests and responses
+
+Uses the fastest library installed: msgspec (``pip install pluggedinkit[fast]``),
+then orjson, then the stdlib. All three produce the same plain dicts and lists,
+and their decoding errors are ValueError subclasses.
+
+Request bodies are encoded to the same bytes as httpx's ``json=`` argument,
+with two exceptions when msgspec or orjson is installed: NaN and infinite
+floats are sent as ``null`` instead of raising ValueError, and values the
+stdlib cannot encode (such as datetime or UUID) may be encoded as strings
+instead of raising TypeError. Anything the fast library rejects, such as
+dict keys that are not strings, is encoded by the stdlib instead.
+
+With ijson installed (``pip install pluggedinkit[stream]``), responses can also
+be parsed incrementally as the body arrives; see ListStreamParser and
+FieldStreamParser.
+"""
+
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional
+
+from ._lazy import is_available, lazy_import
+
+if TYPE_CHECKING:
+    import httpx
+
+_msgspec = lazy_import("msgspec")
+_orjson = lazy_import("orjson")
+_ijson = lazy_import("ijson")
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON document from bytes."""
+    if is_available("msgspec"):
+        return _msgspec.json.decode(content)
+    if is_available("orjson"):
+        return _orjson.loads(content)
+
+    import json
+
+    return json.loads(content)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    encoded: bytes
+    try:
+        if is_available("msgspec"):
+            encoded = _msgspec.json.encode(obj)
+            return encoded
+        if is_available("orjson"):
+            encoded = _orjson.dumps(obj)
+            return encoded
+    except TypeError:
+        # e.g. non-string dict keys, which the stdlib converts to strings
+        pass
+
+    import json
+
+    # Same output as httpx's own json= encoding
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def response_json(response: "httpx.Response") -> Any:
+    """Decode the JSON body of an HTTP response."""
+    if is_available("msgspec"):
+        return _msgspec.json.decode(response.content)
+    if is_available("orjson"):
+        return _orjson.loads(response.content)
+    return response.json()
+
+
+def can_stream() -> bool:
+    """Return True if incremental parsing (ijson) is available."""
+    return is_available("ijson")
+
+
+class ListStreamParser:
+    """Incremental parser for ``{"success": ..., "<key>": [{...}, ...]}`` bodies.
+
+    Feed raw body chunks as they arrive; each call returns the list items
+    completed so far as plain dicts, so only one item is held in memory at a
+    time. ``success`` and ``error`` are filled in once the parser reaches them.
+    Requires ijson; check can_stream() first.
+    """
+
+    __slots__ = ("_builder", "_coro", "_events", "_prefix", "error", "success")
+
+    def __init__(self, key: str):
+        self._prefix = key + ".item"
+        self._events = _ijson.sendable_list()
+        self._coro = _ijson.parse_coro(self._events, use_float=True)
+        self._builder: Any = None
+        self.success: Optional[bool] = None
+        self.error: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body and return newly completed items.
+
+        Raises ValueError on malformed JSON, like the one-shot decoders.
+        """
+        try:
+            self._coro.send(chunk)
+        except _ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """Finish parsing; raises ValueError if the body was incomplete."""
+        try:
+            self._coro.close()
+        except _ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return self._drain()
+
+    def _drain(self) -> List[Any]:
+        items = []
+        builder = self._builder
+        for prefix, event, value in self._events:
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == self._prefix and event == "end_map":
+                    items.append(builder.value)
+                    builder = None
+            elif prefix == self._prefix and event == "start_map":
+                builder = _ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "success":
+                self.success = value
+            elif prefix == "error":
+                self.error = value
+        self._builder = builder
+        del self._events[:]
+        return items
+
+
+class FieldStreamParser:
+    """Incremental parser collecting top-level scalar fields of an object body.
+
+    Feed raw body chunks as they arrive; after each call ``fields`` holds the
+    requested keys parsed so far. Only strings, numbers, booleans and nulls
+    are collected; nested values are skipped without being built. The empty
+    key matches a body that is a bare scalar. Requires ijson; check
+    can_stream() first.
+    """
+
+    __slots__ = ("_coro", "_events", "_keys", "fields")
+
+    _SCALARS = frozenset({"string", "number", "boolean", "null"})
+
+    def __init__(self, keys: Collection[str]):
+        self._keys = frozenset(keys)
+        self._events = _ijson.sendable_list()
+        self._coro = _ijson.parse_coro(self._events, use_float=True)
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body.
+
+        Raises ValueError on malformed JSON, like the one-shot decoders.
+        """
+        try:
+            self._coro.send(chunk)
+        except _ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        self._drain()
+
+    def close(self) -> None:
+        """Finish parsing; raises ValueError if the body was incomplete."""
+        try:
+            self._coro.close()
+        except _ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        self._drain()
+
+    def _drain(self) -> None:
+        keys = self._keys
+        scalars = self._SCALARS
+        for prefix, event, value in self._events:
+            if event in scalars and prefix in keys:
+                self.fields[prefix] = value
+        del self._events[:]
@@ -0,0 +1,47 @@
+"""Deferred imports for optional acceleration dependencies
+
+Optional libraries such as ``msgspec`` or ``orjson`` are only imported the first
+time a code path actually uses them, so callers that never opt into a fast path
+never pay their import cost.
+"""
+
+import importlib
+import importlib.util
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=None)
+def is_available(name: str) -> bool:
+    """Return True if a top-level module can be imported, without importing it"""
+    return importlib.util.find_spec(name) is not None
+
+
+class LazyModule:
+    """Module proxy that imports its target on first attribute access"""
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return a proxy for module ``name`` that imports it on first use.
+
+    Guard optional dependencies with is_available() before touching the proxy;
+    attribute access on a missing module raises ImportError.
+    """
+    return LazyModule(name)
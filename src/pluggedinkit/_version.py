@@ -0,0 +1,17 @@
+"""Package version"""
+
+from functools import lru_cache
+
+# Fallback for source checkouts without installed metadata; keep in sync with pyproject.toml
+__version__ = "1.0.1"
+
+
+@lru_cache(maxsize=1)
+def _sdk_version() -> str:
+    """Installed distribution version, read from package metadata once per process"""
+    try:
+        from importlib.metadata import version
+
+        return version("pluggedinkit")
+    except Exception:
+        return __version__
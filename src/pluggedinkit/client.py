@@ -1,11 +1,14 @@
 """Main client for Plugged.in SDK"""
 
 import asyncio
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
 
+from ._json import dumps
+from ._lazy import is_available
+from ._version import _sdk_version
 from .exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -21,6 +24,8 @@ from .services.agents import AgentService, AsyncAgentService
 DEFAULT_BASE_URL = "https://plugged.in"
 DEFAULT_TIMEOUT = 30.0  # seconds
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
 
 
 class BaseClient:
@@ -33,42 +38,81 @@ class BaseClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
+        pool_size: Optional[int] = None,
     ):
+        if pool_size is not None and pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.debug = debug
+        self.pool_size = pool_size
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path"""
         return urljoin(self.base_url, path)
 
+    def _get_limits(self) -> httpx.Limits:
+        """Get connection pool limits.
+
+        Every service issues its requests through the single HTTP client owned by
+        this object, so idle connections are kept alive long enough for periodic
+        callers (e.g. agent heartbeats) to reuse them instead of reconnecting.
+        ``pool_size`` caps open connections and keeps that many alive; by
+        default connections are uncapped and 32 are kept alive.
+        """
+        if self.pool_size is not None:
+            return httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            )
+        return httpx.Limits(
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
+
+    @staticmethod
+    def _use_http2(http2: Optional[bool]) -> bool:
+        """Resolve the http2 option; None means use HTTP/2 only if h2 is installed"""
+        return is_available("h2") if http2 is None else http2
+
     def _get_headers(self) -> dict:
         """Get default headers"""
         return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
+            "User-Agent": f"pluggedinkit-python/{_sdk_version()}",
         }
 
+    @staticmethod
+    def _error_body(response: httpx.Response) -> dict:
+        """Decode an error response body, tolerating empty or non-JSON bodies"""
+        try:
+            data = response.json()
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
     def _handle_response_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses"""
+        error_data = self._error_body(response)
         if response.status_code == 401:
             raise AuthenticationError(
-                response.json().get("error", "Invalid API key")
+                error_data.get("error", "Invalid API key")
             )
         elif response.status_code == 404:
             raise NotFoundError(
-                response.json().get("error", "Resource not found")
+                error_data.get("error", "Resource not found")
             )
         elif response.status_code == 429:
             retry_after = response.headers.get("retry-after")
             raise RateLimitError(
-                response.json().get("error", "Rate limit exceeded"),
+                error_data.get("error", "Rate limit exceeded"),
                 retry_after=int(retry_after) if retry_after else None,
             )
         elif response.status_code >= 400:
-            error_data = response.json() if response.content else {}
             raise PluggedInError(
                 error_data.get("error", f"Request failed with status {response.status_code}"),
                 status_code=response.status_code,
@@ -86,16 +130,32 @@ class PluggedInClient(BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        http2: Optional[bool] = False,
+        pool_size: Optional[int] = None,
     ):
-        super().__init__(api_key, base_url, timeout, max_retries, debug)
-
-        # Create HTTP client
-        self.http = httpx.Client(
-            base_url=self.base_url,
-            headers=self._get_headers(),
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        super().__init__(api_key, base_url, timeout, max_retries, debug, pool_size)
+
+        # Create the pooled HTTP client shared by all services. A
+        # caller-supplied client is used as-is, so its connection pool can be
+        # shared with other code; it is left open by close(). HTTP/1.1 is
+        # the default. http2=True (requires ``pip install
+        # pluggedinkit[http2]``) multiplexes concurrent requests over one
+        # connection; http2=None opts in only when that extra is installed.
+        self._owns_http = http_client is None
+        if http_client is None:
+            self.http = httpx.Client(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=timeout,
+                limits=self._get_limits(),
+                follow_redirects=True,
+                http2=self._use_http2(http2),
+            )
+            self._request_headers: Optional[dict] = None
+        else:
+            self.http = http_client
+            self._request_headers = self._get_headers()
 
         # Initialize services
         self.clipboard = ClipboardService(self)
@@ -112,36 +172,60 @@ class PluggedInClient(BaseClient):
         params: Optional[dict] = None,
         files: Optional[dict] = None,
         stream: bool = False,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
-        """Make a synchronous HTTP request"""
+        """Make a synchronous HTTP request
+
+        ``json`` is serialized as-is and never modified, so callers may pass
+        shared module-level payloads.
+
+        With ``stream=True`` the body is not read up front; the caller must
+        consume it and call ``response.close()`` when done.
+        """
         url = self._build_url(path)
 
         if self.debug:
             print(f"[PluggedIn SDK] {method} {url}")
             if json:
                 print(f"[PluggedIn SDK] Request body: {json}")
+            elif content:
+                print(f"[PluggedIn SDK] Request body: {content!r}")
 
         # Prepare request kwargs
-        kwargs = {
+        kwargs: Dict[str, Any] = {
             "params": params,
         }
 
+        if self._request_headers is not None:
+            kwargs["headers"] = self._request_headers
+
         if files:
             kwargs["files"] = files
+        elif content is not None:
+            # Pre-serialized JSON body; Content-Type is a default client header
+            kwargs["content"] = content
         elif json is not None:
-            kwargs["json"] = json
+            # Encoded here rather than by httpx so the fastest installed JSON
+            # library is used; Content-Type is a default client header
+            kwargs["content"] = dumps(json)
 
         # Make request with retries
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                response = self.http.request(method, url, **kwargs)
+                if stream:
+                    request = self.http.build_request(method, url, **kwargs)
+                    response = self.http.send(request, stream=True)
+                else:
+                    response = self.http.request(method, url, **kwargs)
 
                 if self.debug:
                     print(f"[PluggedIn SDK] Response: {response.status_code}")
 
                 # Handle errors
                 if response.status_code >= 400:
+                    if stream:
+                        response.read()
                     self._handle_response_error(response)
 
                 return response
@@ -164,11 +248,15 @@ class PluggedInClient(BaseClient):
     def set_api_key(self, api_key: str) -> None:
         """Update the API key"""
         self.api_key = api_key
-        self.http.headers["Authorization"] = f"Bearer {api_key}"
+        if self._owns_http:
+            self.http.headers["Authorization"] = f"Bearer {api_key}"
+        else:
+            self._request_headers = self._get_headers()
 
     def close(self) -> None:
-        """Close the HTTP client"""
-        self.http.close()
+        """Close the HTTP client, unless it was supplied by the caller"""
+        if self._owns_http:
+            self.http.close()
 
     def __enter__(self):
         return self
@@ -187,16 +275,32 @@ class AsyncPluggedInClient(BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        http2: Optional[bool] = False,
+        pool_size: Optional[int] = None,
     ):
-        super().__init__(api_key, base_url, timeout, max_retries, debug)
-
-        # Create async HTTP client
-        self.http = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self._get_headers(),
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        super().__init__(api_key, base_url, timeout, max_retries, debug, pool_size)
+
+        # Create the pooled async HTTP client shared by all services. A
+        # caller-supplied client is used as-is, so its connection pool can be
+        # shared with other code; it is left open by close(). HTTP/1.1 is
+        # the default. http2=True (requires ``pip install
+        # pluggedinkit[http2]``) multiplexes concurrent requests over one
+        # connection; http2=None opts in only when that extra is installed.
+        self._owns_http = http_client is None
+        if http_client is None:
+            self.http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=timeout,
+                limits=self._get_limits(),
+                follow_redirects=True,
+                http2=self._use_http2(http2),
+            )
+            self._request_headers: Optional[dict] = None
+        else:
+            self.http = http_client
+            self._request_headers = self._get_headers()
 
         # Initialize async services
         self.clipboard = AsyncClipboardService(self)
@@ -213,36 +317,60 @@ class AsyncPluggedInClient(BaseClient):
         params: Optional[dict] = None,
         files: Optional[dict] = None,
         stream: bool = False,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
-        """Make an asynchronous HTTP request"""
+        """Make an asynchronous HTTP request
+
+        ``json`` is serialized as-is and never modified, so callers may pass
+        shared module-level payloads.
+
+        With ``stream=True`` the body is not read up front; the caller must
+        consume it and call ``response.aclose()`` when done.
+        """
         url = self._build_url(path)
 
         if self.debug:
             print(f"[PluggedIn SDK] {method} {url}")
             if json:
                 print(f"[PluggedIn SDK] Request body: {json}")
+            elif content:
+                print(f"[PluggedIn SDK] Request body: {content!r}")
 
         # Prepare request kwargs
-        kwargs = {
+        kwargs: Dict[str, Any] = {
             "params": params,
         }
 
+        if self._request_headers is not None:
+            kwargs["headers"] = self._request_headers
+
         if files:
             kwargs["files"] = files
+        elif content is not None:
+            # Pre-serialized JSON body; Content-Type is a default client header
+            kwargs["content"] = content
         elif json is not None:
-            kwargs["json"] = json
+            # Encoded here rather than by httpx so the fastest installed JSON
+            # library is used; Content-Type is a default client header
+            kwargs["content"] = dumps(json)
 
         # Make request with retries
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                response = await self.http.request(method, url, **kwargs)
+                if stream:
+                    request = self.http.build_request(method, url, **kwargs)
+                    response = await self.http.send(request, stream=True)
+                else:
+                    response = await self.http.request(method, url, **kwargs)
 
                 if self.debug:
                     print(f"[PluggedIn SDK] Response: {response.status_code}")
 
                 # Handle errors
                 if response.status_code >= 400:
+                    if stream:
+                        await response.aread()
                     self._handle_response_error(response)
 
                 return response
@@ -264,11 +392,15 @@ class AsyncPluggedInClient(BaseClient):
     def set_api_key(self, api_key: str) -> None:
         """Update the API key"""
         self.api_key = api_key
-        self.http.headers["Authorization"] = f"Bearer {api_key}"
+        if self._owns_http:
+            self.http.headers["Authorization"] = f"Bearer {api_key}"
+        else:
+            self._request_headers = self._get_headers()
 
     async def close(self) -> None:
-        """Close the async HTTP client"""
-        await self.http.aclose()
+        """Close the async HTTP client, unless it was supplied by the caller"""
+        if self._owns_http:
+            await self.http.aclose()
 
     async def __aenter__(self):
         return self
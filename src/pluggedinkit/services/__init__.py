@@ -1,9 +1,32 @@
-"""Service modules for Plugged.in SDK"""
+"""Service modules for Plugged.in SDK
 
-from .clipboard import AsyncClipboardService, ClearAllResult, ClipboardService
-from .documents import AsyncDocumentService, DocumentService
-from .rag import AsyncRagService, RagService
-from .uploads import AsyncUploadService, UploadService
+Service classes are resolved lazily on first attribute access, so importing a
+single service module does not load the others. ``PLUGGEDINKIT_EAGER_IMPORT=1``
+restores eager loading (see the top-level package docstring).
+"""
+
+import importlib
+import os
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .clipboard import AsyncClipboardService, ClearAllResult, ClipboardService
+    from .documents import AsyncDocumentService, DocumentService
+    from .rag import AsyncRagService, RagService
+    from .uploads import AsyncUploadService, UploadService
+
+# Maps each public name to the submodule that defines it
+_LAZY: Dict[str, str] = {
+    "ClipboardService": ".clipboard",
+    "AsyncClipboardService": ".clipboard",
+    "ClearAllResult": ".clipboard",
+    "DocumentService": ".documents",
+    "AsyncDocumentService": ".documents",
+    "RagService": ".rag",
+    "AsyncRagService": ".rag",
+    "UploadService": ".uploads",
+    "AsyncUploadService": ".uploads",
+}
 
 __all__ = [
     "ClipboardService",
@@ -15,4 +38,24 @@ __all__ = [
     "AsyncRagService",
     "UploadService",
     "AsyncUploadService",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the module so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if os.environ.get("PLUGGEDINKIT_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,264 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Request and response helpers for the clipboard services
+
+Kept free of client and service imports so the module can be compiled with
+Cython (see setup.py); the pure-Python source is used when no compiled
+extension is present.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import pydantic
+
+from .._json import ListStreamParser, loads
+from ..exceptions import PluggedInError
+from ..types import (
+    ClipboardEncoding,
+    ClipboardEntry,
+    ClipboardListResponse,
+    ClipboardResponse,
+    ClipboardSource,
+    ClipboardVisibility,
+)
+
+# Wire values keyed by value. The enums subclass str, so members hash and
+# compare equal to their values and hit the same entries.
+_ENCODING_VALUES: Dict[str, str] = {e.value: e.value for e in ClipboardEncoding}
+_VISIBILITY_VALUES: Dict[str, str] = {v.value: v.value for v in ClipboardVisibility}
+_SDK_SOURCE = ClipboardSource.SDK.value
+_DEFAULT_ENCODING = ClipboardEncoding.UTF8
+_DEFAULT_VISIBILITY = ClipboardVisibility.PRIVATE
+_DEFAULT_ENCODING_VALUE = _DEFAULT_ENCODING.value
+_DEFAULT_VISIBILITY_VALUE = _DEFAULT_VISIBILITY.value
+
+
+def normalize_encoding(encoding: Union[ClipboardEncoding, str]) -> str:
+    """Normalize encoding to its ClipboardEncoding wire value."""
+    try:
+        return _ENCODING_VALUES[encoding]
+    except KeyError:
+        raise ValueError(f"{encoding!r} is not a valid ClipboardEncoding") from None
+
+
+def normalize_visibility(visibility: Union[ClipboardVisibility, str]) -> str:
+    """Normalize visibility to its ClipboardVisibility wire value."""
+    try:
+        return _VISIBILITY_VALUES[visibility]
+    except KeyError:
+        raise ValueError(f"{visibility!r} is not a valid ClipboardVisibility") from None
+
+
+def build_clipboard_payload(
+    value: str,
+    name: Optional[str] = None,
+    content_type: str = "text/plain",
+    encoding: Union[ClipboardEncoding, str] = _DEFAULT_ENCODING,
+    visibility: Union[ClipboardVisibility, str] = _DEFAULT_VISIBILITY,
+    created_by_tool: Optional[str] = None,
+    created_by_model: Optional[str] = None,
+    ttl_seconds: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build a clipboard request payload with common fields.
+
+    Normalizes encoding and visibility enums in one place. The services pass
+    arguments positionally, which is measurably cheaper on this hot path.
+    """
+    if (
+        ttl_seconds is None
+        and content_type == "text/plain"
+        and encoding is _DEFAULT_ENCODING
+        and visibility is _DEFAULT_VISIBILITY
+        and not created_by_tool
+        and not created_by_model
+    ):
+        # All-defaults call (the common case): nothing to validate or normalize
+        payload: Dict[str, Any] = {
+            "value": value,
+            "contentType": "text/plain",
+            "encoding": _DEFAULT_ENCODING_VALUE,
+            "visibility": _DEFAULT_VISIBILITY_VALUE,
+            "source": _SDK_SOURCE,
+        }
+        if name:
+            payload["name"] = name
+        return payload
+
+    if ttl_seconds is not None and ttl_seconds <= 0:
+        raise ValueError("ttl_seconds must be greater than 0 when provided")
+
+    payload = {
+        "value": value,
+        "contentType": content_type,
+        # Normalize enums here - callers don't need to. Valid values resolve
+        # with one dict lookup; normalize_*() only runs to raise for bad input.
+        "encoding": _ENCODING_VALUES.get(encoding) or normalize_encoding(encoding),
+        "visibility": _VISIBILITY_VALUES.get(visibility) or normalize_visibility(visibility),
+        "source": _SDK_SOURCE,
+    }
+
+    if name:
+        payload["name"] = name
+    if created_by_tool:
+        payload["createdByTool"] = created_by_tool
+    if created_by_model:
+        payload["createdByModel"] = created_by_model
+    if ttl_seconds is not None:
+        payload["ttlSeconds"] = ttl_seconds
+
+    return payload
+
+
+def parse_list_response(
+    data: Dict[str, Any],
+    error_msg: str = "Failed to list clipboard entries",
+) -> List[ClipboardEntry]:
+    """Parse a response carrying an ``entries`` list and raise on failure."""
+    if not data.get("success"):
+        raise PluggedInError(data.get("error", error_msg))
+    return ClipboardListResponse.model_validate(data).entries
+
+
+def iter_list_response(data: Dict[str, Any]) -> Iterator[ClipboardEntry]:
+    """Check a list response and validate its entries one at a time, on demand.
+
+    Raises immediately if the response reports failure; entries are only
+    validated as the returned iterator is consumed.
+    """
+    if not data.get("success"):
+        raise PluggedInError(data.get("error", "Failed to list clipboard entries"))
+    return map(ClipboardEntry.model_validate, data.get("entries") or ())
+
+
+def new_list_stream_parser() -> ListStreamParser:
+    """Incremental parser for a streamed list response body."""
+    return ListStreamParser("entries")
+
+
+def check_list_stream(parser: ListStreamParser) -> None:
+    """Raise if a fully parsed list stream did not report success."""
+    if not parser.success:
+        raise PluggedInError(parser.error or "Failed to list clipboard entries")
+
+
+def iter_list_stream(chunks: Iterable[bytes]) -> Iterator[ClipboardEntry]:
+    """Validate entries from a list response body as its chunks arrive."""
+    parser = new_list_stream_parser()
+    for chunk in chunks:
+        yield from map(ClipboardEntry.model_validate, parser.feed(chunk))
+    yield from map(ClipboardEntry.model_validate, parser.close())
+    check_list_stream(parser)
+
+
+def parse_entry_response(
+    data: Dict[str, Any],
+    error_msg: str = "Operation failed",
+    raise_on_failure: bool = True,
+) -> Optional[ClipboardEntry]:
+    """Parse entry response with consistent error handling.
+
+    Args:
+        data: API response data
+        error_msg: Error message to use if raising
+        raise_on_failure: If True, raises PluggedInError on failure.
+                         If False, returns None on failure.
+
+    Returns:
+        ClipboardEntry on success, None on failure (if not raising)
+
+    Raises:
+        PluggedInError: If raise_on_failure is True and operation failed
+    """
+    if not data.get("success"):
+        if raise_on_failure:
+            raise PluggedInError(data.get("error", error_msg))
+        return None
+
+    entry = data.get("entry")
+    if entry:
+        return ClipboardEntry.model_validate(entry)
+
+    if raise_on_failure:
+        raise PluggedInError(data.get("error", error_msg))
+    return None
+
+
+def parse_list_bytes(
+    content: bytes,
+    error_msg: str = "Failed to list clipboard entries",
+) -> List[ClipboardEntry]:
+    """Decode and validate a raw list response body in one pass.
+
+    pydantic-core parses the JSON and builds the models together, skipping the
+    intermediate dicts; failure bodies take the parse_list_response() path.
+    """
+    try:
+        parsed = ClipboardListResponse.model_validate_json(content)
+    except pydantic.ValidationError:
+        parsed = None
+    if parsed is None or not parsed.success:
+        return parse_list_response(loads(content), error_msg)
+    return parsed.entries
+
+
+def parse_entry_bytes(
+    content: bytes,
+    error_msg: str = "Operation failed",
+    raise_on_failure: bool = True,
+) -> Optional[ClipboardEntry]:
+    """Raw-body counterpart of parse_entry_response(), validated in one pass."""
+    try:
+        parsed = ClipboardResponse.model_validate_json(content)
+    except pydantic.ValidationError:
+        return parse_entry_response(loads(content), error_msg, raise_on_failure)
+    if parsed.success and parsed.entry is not None:
+        return parsed.entry
+    if raise_on_failure:
+        raise PluggedInError(parsed.error or error_msg)
+    return None
+
+
+def unwrap_entry(content: bytes, error_msg: str) -> ClipboardEntry:
+    """Return the entry from a raw response body, raising PluggedInError on failure."""
+    entry = parse_entry_bytes(content, error_msg=error_msg, raise_on_failure=True)
+    # entry is guaranteed non-None when raise_on_failure=True
+    assert entry is not None
+    return entry
+
+
+def parse_delete_response(data: Dict[str, Any]) -> int:
+    """Parse delete response and return deleted count.
+
+    Returns:
+        Number of deleted entries (0 if failed)
+    """
+    if not data.get("success"):
+        return 0
+    deleted = data.get("deleted", 0)
+    return int(deleted) if deleted is not None else 0
+
+
+# Get/delete validate their selectors inline rather than building the
+# ClipboardGetFilters/ClipboardDeleteRequest Pydantic models on every call
+_MISSING_SELECTOR = "Either 'name' or 'idx' must be provided"
+
+
+def build_get_params(name: Optional[str], idx: Optional[int]) -> Dict[str, str]:
+    """Build query params for fetching an entry by name or index."""
+    if idx is None:
+        if name is None:
+            raise ValueError(_MISSING_SELECTOR)
+        return {"name": name}
+    if name is None:
+        return {"idx": f"{idx}"}
+    return {"name": name, "idx": f"{idx}"}
+
+
+def build_delete_payload(name: Optional[str], idx: Optional[int]) -> Dict[str, Any]:
+    """Build the request body for deleting an entry by name or index."""
+    if idx is None:
+        if name is None:
+            raise ValueError(_MISSING_SELECTOR)
+        return {"name": name}
+    if name is None:
+        return {"idx": idx}
+    return {"name": name, "idx": idx}
@@ -1,136 +1,339 @@
 """Agent management service for PAP (Plugged.in Agent Protocol)"""
 
-from typing import Any, Dict, List, Literal, Optional, TypedDict
-
-
-class Agent(TypedDict, total=False):
-    """PAP Agent"""
-    uuid: str
-    name: str
-    dns_name: str
-    state: Literal['NEW', 'PROVISIONED', 'ACTIVE', 'DRAINING', 'TERMINATED', 'KILLED']
-    kubernetes_namespace: Optional[str]
-    kubernetes_deployment: Optional[str]
-    created_at: str
-    provisioned_at: Optional[str]
-    activated_at: Optional[str]
-    terminated_at: Optional[str]
-    last_heartbeat_at: Optional[str]
-    metadata: Optional[Dict[str, Any]]
-
-
-class ResourceRequirements(TypedDict, total=False):
-    """Kubernetes resource requirements"""
-    cpu_request: Optional[str]
-    memory_request: Optional[str]
-    cpu_limit: Optional[str]
-    memory_limit: Optional[str]
-
-
-class CreateAgentRequest(TypedDict, total=False):
-    """Request to create a new agent"""
-    name: str
-    description: Optional[str]
-    image: Optional[str]
-    resources: Optional[ResourceRequirements]
-
-
-class Heartbeat(TypedDict):
-    """Agent heartbeat (liveness only - zombie prevention)"""
-    mode: Literal['EMERGENCY', 'IDLE', 'SLEEP']
-    uptime_seconds: float
-    timestamp: str
-
-
-class Metrics(TypedDict, total=False):
-    """Agent metrics (resource telemetry - separate from heartbeat)"""
-    cpu_percent: float
-    memory_mb: float
-    requests_handled: int
-    timestamp: str
-    custom_metrics: Optional[Dict[str, Any]]
-
-
-class LifecycleEvent(TypedDict):
-    """Agent lifecycle event"""
-    event_type: str
-    from_state: Optional[str]
-    to_state: str
-    timestamp: str
-    metadata: Optional[Dict[str, Any]]
-
-
-class AgentDetails(TypedDict):
-    """Detailed agent information"""
-    agent: Agent
-    recentHeartbeats: List[Heartbeat]
-    recentMetrics: List[Metrics]
-    lifecycleEvents: List[LifecycleEvent]
-    kubernetesStatus: Optional[Dict[str, Any]]
-
-
-class AgentService:
+from __future__ import annotations
+
+import asyncio
+import builtins
+import contextlib
+import logging
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
+
+from .._json import response_json
+from ..exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from typing import Literal, TypedDict
+
+    from ..client import AsyncPluggedInClient, PluggedInClient
+
+    HeartbeatMode = Literal['EMERGENCY', 'IDLE', 'SLEEP']
+
+    class Agent(TypedDict, total=False):
+        """PAP Agent"""
+        uuid: str
+        name: str
+        dns_name: str
+        state: Literal['NEW', 'PROVISIONED', 'ACTIVE', 'DRAINING', 'TERMINATED', 'KILLED']
+        kubernetes_namespace: str | None
+        kubernetes_deployment: str | None
+        created_at: str
+        provisioned_at: str | None
+        activated_at: str | None
+        terminated_at: str | None
+        last_heartbeat_at: str | None
+        metadata: dict[str, Any] | None
+
+    class ResourceRequirements(TypedDict, total=False):
+        """Kubernetes resource requirements"""
+        cpu_request: str | None
+        memory_request: str | None
+        cpu_limit: str | None
+        memory_limit: str | None
+
+    class CreateAgentRequest(TypedDict, total=False):
+        """Request to create a new agent"""
+        name: str
+        description: str | None
+        image: str | None
+        resources: ResourceRequirements | None
+
+    class Heartbeat(TypedDict):
+        """Agent heartbeat (liveness only - zombie prevention)"""
+        mode: HeartbeatMode
+        uptime_seconds: float
+        timestamp: str
+
+    class Metrics(TypedDict, total=False):
+        """Agent metrics (resource telemetry - separate from heartbeat)"""
+        cpu_percent: float
+        memory_mb: float
+        requests_handled: int
+        timestamp: str
+        custom_metrics: dict[str, Any] | None
+
+    class LifecycleEvent(TypedDict):
+        """Agent lifecycle event"""
+        event_type: str
+        from_state: str | None
+        to_state: str
+        timestamp: str
+        metadata: dict[str, Any] | None
+
+    class AgentDetails(TypedDict):
+        """Detailed agent information"""
+        agent: Agent
+        recentHeartbeats: list[Heartbeat]
+        recentMetrics: list[Metrics]
+        lifecycleEvents: list[LifecycleEvent]
+        kubernetesStatus: dict[str, Any] | None
+else:
+    # The TypedDicts above only document the JSON shapes for type checkers; the
+    # service methods return plain dicts, so skip building them at runtime.
+    Agent = ResourceRequirements = CreateAgentRequest = Heartbeat = dict
+    Metrics = LifecycleEvent = AgentDetails = dict
+
+
+_BASE = '/api/agents'
+_EXPORT_SUFFIX = '/export'
+_HEARTBEAT_SUFFIX = '/heartbeat'
+_METRICS_SUFFIX = '/metrics'
+
+# Route table: operation name -> (HTTP method, path suffix after
+# /api/agents/{agent_id}), with None marking collection routes on /api/agents
+_ROUTES: dict[str, tuple[str, str | None]] = {
+    'list': ('GET', None),
+    'create': ('POST', None),
+    'get': ('GET', ''),
+    'delete': ('DELETE', ''),
+    'export': ('POST', _EXPORT_SUFFIX),
+    'heartbeat': ('POST', _HEARTBEAT_SUFFIX),
+    'metrics': ('POST', _METRICS_SUFFIX),
+}
+
+# Per-agent routes, split out once at import: (operation name, HTTP method, suffix)
+_AGENT_ROUTES = tuple(
+    (name, method, suffix) for name, (method, suffix) in _ROUTES.items() if suffix is not None
+)
+
+# Upper bound on the number of agents whose request paths are cached per service
+_PATH_CACHE_SIZE = 1024
+
+# Valid heartbeat modes. Heartbeat bodies are formatted straight to bytes,
+# skipping the dict + json.dumps round trip on the hot liveness path.
+_HEARTBEAT_MODES = frozenset(('EMERGENCY', 'IDLE', 'SLEEP'))
+_HEARTBEAT_TMPL = b'{"mode":"%s","uptime_seconds":%a}'
+
+# Callback invoked with (agent_id, exception) when a batched submission fails
+ErrorHandler = Callable[[str, BaseException], None]
+
+_logger = logging.getLogger(__name__)
+
+
+def _report_error(on_error: ErrorHandler | None, agent_id: str, error: BaseException) -> None:
+    """Pass a failed batched submission to on_error.
+
+    Errors raised by the handler itself are logged rather than propagated,
+    so a faulty callback cannot stop the batcher's background flushes.
+    """
+    if on_error is None:
+        return
+    try:
+        on_error(agent_id, error)
+    except Exception:
+        _logger.exception('Heartbeat batcher on_error handler failed for agent %s', agent_id)
+
+
+def _log_flusher_exit(task: asyncio.Task[None]) -> None:
+    """Log the error that stopped an async batcher's flusher task, if any."""
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error('Heartbeat batcher flusher stopped', exc_info=task.exception())
+
+
+def _decode(response: Any, fast: bool) -> Any:
+    """Decode a JSON response body.
+
+    With ``fast=True`` the body is decoded by the fastest available decoder
+    (msgspec, then orjson, then the stdlib json module) instead of always
+    using the stdlib json module like ``response.json()``.
+    """
+    if fast:
+        return response_json(response)
+    return response.json()
+
+
+def _build_export_payload(include_telemetry: bool, telemetry_limit: int) -> dict[str, Any]:
+    """Build the request body for an agent export."""
+    return {
+        'include_telemetry': include_telemetry,
+        'telemetry_limit': telemetry_limit,
+    }
+
+
+def _check_heartbeat_mode(mode: str) -> None:
+    """Raise ValidationError unless mode is a PAP heartbeat mode."""
+    if mode not in _HEARTBEAT_MODES:
+        raise ValidationError(
+            f"invalid mode {mode!r}; expected one of {', '.join(sorted(_HEARTBEAT_MODES))}"
+        )
+
+
+def _heartbeat_body(mode: str, uptime_seconds: float) -> dict[str, Any]:
+    """Build the request body kwargs for a heartbeat (liveness only).
+
+    A finite int/float uptime is formatted directly into a JSON byte string;
+    anything else goes through the regular ``json=`` path so the server can
+    validate it.
+
+    Raises:
+        ValidationError: If mode is not a PAP heartbeat mode
+    """
+    _check_heartbeat_mode(mode)
+    if type(uptime_seconds) in (int, float) and math.isfinite(uptime_seconds):
+        return {'content': _HEARTBEAT_TMPL % (mode.encode('ascii'), uptime_seconds)}
+    return {
+        'json': {
+            'mode': mode,
+            'uptime_seconds': uptime_seconds,
+        }
+    }
+
+
+def _build_metrics_payload(
+    cpu_percent: float,
+    memory_mb: float,
+    requests_handled: int,
+    custom_metrics: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the request body for a metrics submission."""
+    return {
+        'cpu_percent': cpu_percent,
+        'memory_mb': memory_mb,
+        'requests_handled': requests_handled,
+        'custom_metrics': custom_metrics,
+    }
+
+
+class _AgentServiceBase:
+    """Route resolution shared by the sync and async agent services"""
+
+    __slots__ = ('_paths', '_paths_lock', 'client')
+
+    def __init__(self) -> None:
+        # agent_id -> {operation name: (method, path)}, least recently used first
+        self._paths: OrderedDict[str, dict[str, tuple[str, str]]] = OrderedDict()
+        # HeartbeatBatcher resolves routes from several worker threads
+        self._paths_lock = threading.Lock()
+
+    def _paths_for(self, agent_id: str) -> dict[str, tuple[str, str]]:
+        """Return the per-agent (method, path) routes, building them on first use.
+
+        Agents that heartbeat every second hit the same handful of paths
+        repeatedly, so they are built once per agent and kept in a bounded
+        LRU cache.
+        """
+        with self._paths_lock:
+            paths = self._paths.get(agent_id)
+            if paths is None:
+                base = _BASE + '/' + agent_id
+                paths = {name: (method, base + suffix) for name, method, suffix in _AGENT_ROUTES}
+                self._paths[agent_id] = paths
+                if len(self._paths) > _PATH_CACHE_SIZE:
+                    self._paths.popitem(last=False)
+            else:
+                self._paths.move_to_end(agent_id)
+            return paths
+
+    def _endpoint(self, name: str, agent_id: str | None = None) -> tuple[str, str]:
+        """Resolve an operation name to its HTTP method and request path."""
+        if agent_id is None:
+            return _ROUTES[name][0], _BASE
+        return self._paths_for(agent_id)[name]
+
+
+class AgentService(_AgentServiceBase):
     """Synchronous agent service"""
 
-    def __init__(self, client: 'PluggedInClient'):
+    __slots__ = ()
+
+    def __init__(self, client: PluggedInClient):
+        super().__init__()
         self.client = client
 
-    def list(self) -> List[Agent]:
-        """List all PAP agents"""
-        response = self.client.request('GET', '/api/agents')
-        return response.json()
+    def list(self, fast: bool = False) -> builtins.list[Agent]:
+        """List all PAP agents (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('list')
+        response = self.client.request(method, path)
+        return _decode(response, fast)
 
-    def create(self, request: CreateAgentRequest) -> Dict[str, Any]:
+    def iter_list(self, page_size: int = 100) -> Iterator[Agent]:
+        """
+        Iterate over all PAP agents, one page at a time.
+
+        Pages are requested with ``limit``/``cursor`` query parameters and followed
+        via the response's ``next_cursor``, so only one page is held in memory and
+        callers that stop early never fetch the rest. A server that returns a plain
+        list is treated as a single page. list() still returns the full list.
+        """
+        method, path = self._endpoint('list')
+        params: dict[str, Any] = {'limit': page_size}
+        while True:
+            response = self.client.request(method, path, params=params)
+            data = response.json()
+            if isinstance(data, list):
+                yield from data
+                return
+            yield from data.get('items', [])
+            cursor = data.get('next_cursor')
+            if not cursor:
+                return
+            params = {'limit': page_size, 'cursor': cursor}
+
+    def create(self, request: CreateAgentRequest) -> dict[str, Any]:
         """Create a new PAP agent"""
-        response = self.client.request('POST', '/api/agents', json=request)
+        method, path = self._endpoint('create')
+        response = self.client.request(method, path, json=request)
         return response.json()
 
-    def get(self, agent_id: str) -> AgentDetails:
-        """Get details for a specific agent"""
-        response = self.client.request('GET', f'/api/agents/{agent_id}')
-        return response.json()
+    def get(self, agent_id: str, fast: bool = False) -> AgentDetails:
+        """Get details for a specific agent (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('get', agent_id)
+        response = self.client.request(method, path)
+        return _decode(response, fast)
 
-    def delete(self, agent_id: str) -> Dict[str, Any]:
+    def delete(self, agent_id: str) -> dict[str, Any]:
         """Delete an agent (terminates deployment)"""
-        response = self.client.request('DELETE', f'/api/agents/{agent_id}')
+        method, path = self._endpoint('delete', agent_id)
+        response = self.client.request(method, path)
         return response.json()
 
     def export(
         self,
         agent_id: str,
         include_telemetry: bool = True,
-        telemetry_limit: int = 100
-    ) -> Dict[str, Any]:
-        """Export agent data including telemetry"""
+        telemetry_limit: int = 100,
+        fast: bool = False,
+    ) -> dict[str, Any]:
+        """Export agent data including telemetry (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('export', agent_id)
         response = self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/export',
-            json={
-                'include_telemetry': include_telemetry,
-                'telemetry_limit': telemetry_limit,
-            }
+            method,
+            path,
+            json=_build_export_payload(include_telemetry, telemetry_limit),
         )
-        return response.json()
+        return _decode(response, fast)
 
     def heartbeat(
         self,
         agent_id: str,
-        mode: Literal['EMERGENCY', 'IDLE', 'SLEEP'],
+        mode: HeartbeatMode,
         uptime_seconds: float
-    ) -> Dict[str, str]:
+    ) -> dict[str, str]:
         """
         Submit a heartbeat for an agent.
 
         CRITICAL: Heartbeats are liveness-only (PAP zombie prevention).
         Never include resource data (CPU, memory) in heartbeats - use metrics() instead.
+
+        Raises:
+            ValidationError: If mode is not EMERGENCY, IDLE or SLEEP
         """
+        method, path = self._endpoint('heartbeat', agent_id)
         response = self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/heartbeat',
-            json={
-                'mode': mode,
-                'uptime_seconds': uptime_seconds,
-            }
+            method, path, **_heartbeat_body(mode, uptime_seconds)
         )
         return response.json()
 
@@ -140,89 +343,117 @@ class AgentService:
         cpu_percent: float,
         memory_mb: float,
         requests_handled: int,
-        custom_metrics: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, str]:
+        custom_metrics: dict[str, Any] | None = None
+    ) -> dict[str, str]:
         """
         Submit metrics for an agent.
 
         CRITICAL: Metrics are separate from heartbeats (PAP zombie prevention).
         Heartbeats are liveness-only, metrics are resource telemetry.
         """
+        method, path = self._endpoint('metrics', agent_id)
         response = self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/metrics',
-            json={
-                'cpu_percent': cpu_percent,
-                'memory_mb': memory_mb,
-                'requests_handled': requests_handled,
-                'custom_metrics': custom_metrics,
-            }
+            method,
+            path,
+            json=_build_metrics_payload(
+                cpu_percent, memory_mb, requests_handled, custom_metrics
+            ),
         )
         return response.json()
 
 
-class AsyncAgentService:
+class AsyncAgentService(_AgentServiceBase):
     """Asynchronous agent service"""
 
-    def __init__(self, client: 'AsyncPluggedInClient'):
+    __slots__ = ()
+
+    def __init__(self, client: AsyncPluggedInClient):
+        super().__init__()
         self.client = client
 
-    async def list(self) -> List[Agent]:
-        """List all PAP agents"""
-        response = await self.client.request('GET', '/api/agents')
-        return response.json()
+    async def list(self, fast: bool = False) -> builtins.list[Agent]:
+        """List all PAP agents (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('list')
+        response = await self.client.request(method, path)
+        return _decode(response, fast)
+
+    async def iter_list(self, page_size: int = 100) -> AsyncIterator[Agent]:
+        """
+        Iterate over all PAP agents, one page at a time.
 
-    async def create(self, request: CreateAgentRequest) -> Dict[str, Any]:
+        Pages are requested with ``limit``/``cursor`` query parameters and followed
+        via the response's ``next_cursor``, so only one page is held in memory and
+        callers that stop early never fetch the rest. A server that returns a plain
+        list is treated as a single page. list() still returns the full list.
+        """
+        method, path = self._endpoint('list')
+        params: dict[str, Any] = {'limit': page_size}
+        while True:
+            response = await self.client.request(method, path, params=params)
+            data = response.json()
+            if isinstance(data, list):
+                for agent in data:
+                    yield agent
+                return
+            for agent in data.get('items', []):
+                yield agent
+            cursor = data.get('next_cursor')
+            if not cursor:
+                return
+            params = {'limit': page_size, 'cursor': cursor}
+
+    async def create(self, request: CreateAgentRequest) -> dict[str, Any]:
         """Create a new PAP agent"""
-        response = await self.client.request('POST', '/api/agents', json=request)
+        method, path = self._endpoint('create')
+        response = await self.client.request(method, path, json=request)
         return response.json()
 
-    async def get(self, agent_id: str) -> AgentDetails:
-        """Get details for a specific agent"""
-        response = await self.client.request('GET', f'/api/agents/{agent_id}')
-        return response.json()
+    async def get(self, agent_id: str, fast: bool = False) -> AgentDetails:
+        """Get details for a specific agent (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('get', agent_id)
+        response = await self.client.request(method, path)
+        return _decode(response, fast)
 
-    async def delete(self, agent_id: str) -> Dict[str, Any]:
+    async def delete(self, agent_id: str) -> dict[str, Any]:
         """Delete an agent (terminates deployment)"""
-        response = await self.client.request('DELETE', f'/api/agents/{agent_id}')
+        method, path = self._endpoint('delete', agent_id)
+        response = await self.client.request(method, path)
         return response.json()
 
     async def export(
         self,
         agent_id: str,
         include_telemetry: bool = True,
-        telemetry_limit: int = 100
-    ) -> Dict[str, Any]:
-        """Export agent data including telemetry"""
+        telemetry_limit: int = 100,
+        fast: bool = False,
+    ) -> dict[str, Any]:
+        """Export agent data including telemetry (``fast=True``: fastest available decoder)"""
+        method, path = self._endpoint('export', agent_id)
         response = await self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/export',
-            json={
-                'include_telemetry': include_telemetry,
-                'telemetry_limit': telemetry_limit,
-            }
+            method,
+            path,
+            json=_build_export_payload(include_telemetry, telemetry_limit),
         )
-        return response.json()
+        return _decode(response, fast)
 
     async def heartbeat(
         self,
         agent_id: str,
-        mode: Literal['EMERGENCY', 'IDLE', 'SLEEP'],
+        mode: HeartbeatMode,
         uptime_seconds: float
-    ) -> Dict[str, str]:
+    ) -> dict[str, str]:
         """
         Submit a heartbeat for an agent.
 
         CRITICAL: Heartbeats are liveness-only (PAP zombie prevention).
         Never include resource data (CPU, memory) in heartbeats - use metrics() instead.
+
+        Raises:
+            ValidationError: If mode is not EMERGENCY, IDLE or SLEEP
         """
+        method, path = self._endpoint('heartbeat', agent_id)
         response = await self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/heartbeat',
-            json={
-                'mode': mode,
-                'uptime_seconds': uptime_seconds,
-            }
+            method, path, **_heartbeat_body(mode, uptime_seconds)
         )
         return response.json()
 
@@ -232,22 +463,304 @@ class AsyncAgentService:
         cpu_percent: float,
         memory_mb: float,
         requests_handled: int,
-        custom_metrics: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, str]:
+        custom_metrics: dict[str, Any] | None = None
+    ) -> dict[str, str]:
         """
         Submit metrics for an agent.
 
         CRITICAL: Metrics are separate from heartbeats (PAP zombie prevention).
         Heartbeats are liveness-only, metrics are resource telemetry.
         """
+        method, path = self._endpoint('metrics', agent_id)
         response = await self.client.request(
-            'POST',
-            f'/api/agents/{agent_id}/metrics',
-            json={
-                'cpu_percent': cpu_percent,
-                'memory_mb': memory_mb,
-                'requests_handled': requests_handled,
-                'custom_metrics': custom_metrics,
-            }
+            method,
+            path,
+            json=_build_metrics_payload(
+                cpu_percent, memory_mb, requests_handled, custom_metrics
+            ),
         )
         return response.json()
+
+
+class _Sample:
+    """Latest heartbeat + metrics reading buffered for one agent"""
+
+    __slots__ = (
+        'cpu_percent',
+        'custom_metrics',
+        'memory_mb',
+        'mode',
+        'requests_handled',
+        'uptime_seconds',
+    )
+
+    def __init__(
+        self,
+        mode: HeartbeatMode,
+        uptime_seconds: float,
+        cpu_percent: float,
+        memory_mb: float,
+        requests_handled: int,
+        custom_metrics: dict[str, Any] | None,
+    ):
+        self.mode = mode
+        self.uptime_seconds = uptime_seconds
+        self.cpu_percent = cpu_percent
+        self.memory_mb = memory_mb
+        self.requests_handled = requests_handled
+        self.custom_metrics = custom_metrics
+
+
+class AsyncHeartbeatBatcher:
+    """
+    Coalesce per-tick heartbeat and metrics submissions for many agents.
+
+    Readings passed to submit() are buffered and flushed every ``interval_ms``
+    (or as soon as ``max_batch`` agents are waiting). A flush sends every
+    buffered heartbeat and metrics request concurrently over the client's
+    shared connection pool instead of one round trip after another. If an agent
+    submits more than once within a window, only its latest reading is sent.
+
+    Heartbeats and metrics are still submitted as separate requests, so the PAP
+    liveness/telemetry split is preserved.
+    """
+
+    def __init__(
+        self,
+        service: AsyncAgentService,
+        interval_ms: int = 500,
+        max_batch: int = 64,
+        on_error: ErrorHandler | None = None,
+    ):
+        self.service = service
+        self.interval = interval_ms / 1000
+        self.max_batch = max_batch
+        self.on_error = on_error
+        self._pending: dict[str, _Sample] = {}
+        self._full: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def submit(
+        self,
+        agent_id: str,
+        mode: HeartbeatMode,
+        uptime_seconds: float,
+        cpu_percent: float,
+        memory_mb: float,
+        requests_handled: int,
+        custom_metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer a heartbeat and metrics reading for the next flush
+
+        Raises:
+            ValidationError: If mode is not EMERGENCY, IDLE or SLEEP
+            RuntimeError: If the batcher has been closed
+        """
+        _check_heartbeat_mode(mode)
+        if self._closed:
+            raise RuntimeError('AsyncHeartbeatBatcher is closed')
+        self._pending[agent_id] = _Sample(
+            mode, uptime_seconds, cpu_percent, memory_mb, requests_handled, custom_metrics
+        )
+        if self._task is None or self._task.done():
+            # First submission, or the flusher died: (re)start it
+            if self._task is not None:
+                _log_flusher_exit(self._task)
+            self._full = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if len(self._pending) >= self.max_batch:
+            assert self._full is not None
+            self._full.set()
+
+    async def flush(self) -> None:
+        """Send every buffered reading now"""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        agent_ids = []
+        calls = []
+        for agent_id, sample in pending.items():
+            agent_ids += [agent_id, agent_id]
+            calls.append(self.service.heartbeat(agent_id, sample.mode, sample.uptime_seconds))
+            calls.append(
+                self.service.metrics(
+                    agent_id,
+                    sample.cpu_percent,
+                    sample.memory_mb,
+                    sample.requests_handled,
+                    sample.custom_metrics,
+                )
+            )
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for agent_id, result in zip(agent_ids, results):
+            if isinstance(result, Exception):
+                _report_error(self.on_error, agent_id, result)
+
+    async def close(self) -> None:
+        """Stop the background flusher and send anything still buffered
+
+        Once closed, the batcher rejects further submissions.
+        """
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            if task.done():
+                _log_flusher_exit(task)
+            else:
+                # Wake the flusher and let it finish rather than cancelling it,
+                # so a flush already in progress still delivers its readings
+                assert self._full is not None
+                self._full.set()
+                await task
+        await self.flush()
+
+    async def _run(self) -> None:
+        assert self._full is not None
+        while not self._closed:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._full.wait(), self.interval)
+            self._full.clear()
+            if self._closed:
+                return
+            await self.flush()
+
+    async def __aenter__(self) -> AsyncHeartbeatBatcher:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class HeartbeatBatcher:
+    """
+    Thread-based counterpart of AsyncHeartbeatBatcher for AgentService.
+
+    A background thread flushes buffered readings every ``interval_ms`` (or as
+    soon as ``max_batch`` agents are waiting), issuing the heartbeat and metrics
+    requests concurrently from a small thread pool that shares the client's
+    connection pool.
+    """
+
+    def __init__(
+        self,
+        service: AgentService,
+        interval_ms: int = 500,
+        max_batch: int = 64,
+        max_workers: int = 8,
+        on_error: ErrorHandler | None = None,
+    ):
+        self.service = service
+        self.interval = interval_ms / 1000
+        self.max_batch = max_batch
+        self.on_error = on_error
+        self._pending: dict[str, _Sample] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes with the executor shutdown in close()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='pluggedin-heartbeat'
+        )
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        agent_id: str,
+        mode: HeartbeatMode,
+        uptime_seconds: float,
+        cpu_percent: float,
+        memory_mb: float,
+        requests_handled: int,
+        custom_metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer a heartbeat and metrics reading for the next flush
+
+        Raises:
+            ValidationError: If mode is not EMERGENCY, IDLE or SLEEP
+            RuntimeError: If the batcher has been closed
+        """
+        _check_heartbeat_mode(mode)
+        sample = _Sample(
+            mode, uptime_seconds, cpu_percent, memory_mb, requests_handled, custom_metrics
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('HeartbeatBatcher is closed')
+            self._pending[agent_id] = sample
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='pluggedin-heartbeat-batcher', daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= self.max_batch:
+                self._wake.set()
+
+    def flush(self) -> None:
+        """Send every buffered reading now"""
+        with self._flush_lock:
+            # Nothing can be buffered once close() has shut the executor down
+            if not self._stopped:
+                self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        futures = []
+        for agent_id, sample in pending.items():
+            heartbeat = self._executor.submit(
+                self.service.heartbeat, agent_id, sample.mode, sample.uptime_seconds
+            )
+            metrics = self._executor.submit(
+                self.service.metrics,
+                agent_id,
+                sample.cpu_percent,
+                sample.memory_mb,
+                sample.requests_handled,
+                sample.custom_metrics,
+            )
+            futures += [(agent_id, heartbeat), (agent_id, metrics)]
+
+        for agent_id, future in futures:
+            error = future.exception()
+            if error is not None:
+                _report_error(self.on_error, agent_id, error)
+
+    def close(self) -> None:
+        """Stop the background flusher and send anything still buffered
+
+        Once closed, the batcher rejects further submissions.
+        """
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+        with self._flush_lock:
+            if not self._stopped:
+                self._flush()
+                self._stopped = True
+                self._executor.shutdown(wait=True)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._closed:
+                return
+            self.flush()
+
+    def __enter__(self) -> HeartbeatBatcher:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
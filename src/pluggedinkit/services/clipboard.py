@@ -4,164 +4,77 @@ This module provides both synchronous and asynchronous clipboard services
 for persistent key-value and stack-based storage in AI workflows.
 """
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+from .._batching import AsyncBatcher
+from .._cache import DEFAULT_MAXSIZE, TTLCache
+from .._json import can_stream, loads, response_json
 from ..exceptions import PluggedInError
-from ..types import (
-    ClipboardDeleteRequest,
-    ClipboardEncoding,
-    ClipboardEntry,
-    ClipboardGetFilters,
-    ClipboardListResponse,
-    ClipboardSource,
-    ClipboardVisibility,
+from ..types import ClipboardEncoding, ClipboardEntry, ClipboardVisibility
+from ._clipboard_helpers import (
+    build_clipboard_payload,
+    build_delete_payload,
+    build_get_params,
+    check_list_stream,
+    iter_list_response,
+    iter_list_stream,
+    new_list_stream_parser,
+    parse_delete_response,
+    parse_entry_bytes,
+    parse_list_bytes,
+    unwrap_entry,
 )
 
 if TYPE_CHECKING:
     from ..client import AsyncPluggedInClient, PluggedInClient
 
+__all__ = ["AsyncClipboardService", "ClearAllResult", "ClipboardService"]
 
-# -----------------------------------------------------------------------------
-# Shared Helper Functions
-# -----------------------------------------------------------------------------
-
-
-def _normalize_encoding(
-    encoding: Union[ClipboardEncoding, str]
-) -> ClipboardEncoding:
-    """Normalize encoding to ClipboardEncoding enum."""
-    if isinstance(encoding, ClipboardEncoding):
-        return encoding
-    return ClipboardEncoding(encoding)
-
-
-def _normalize_visibility(
-    visibility: Union[ClipboardVisibility, str]
-) -> ClipboardVisibility:
-    """Normalize visibility to ClipboardVisibility enum."""
-    if isinstance(visibility, ClipboardVisibility):
-        return visibility
-    return ClipboardVisibility(visibility)
-
-
-def _build_clipboard_payload(
-    value: str,
-    name: Optional[str] = None,
-    content_type: str = "text/plain",
-    encoding: Union[ClipboardEncoding, str] = ClipboardEncoding.UTF8,
-    visibility: Union[ClipboardVisibility, str] = ClipboardVisibility.PRIVATE,
-    created_by_tool: Optional[str] = None,
-    created_by_model: Optional[str] = None,
-    ttl_seconds: Optional[int] = None,
-) -> Dict[str, Any]:
-    """Build a clipboard request payload with common fields.
-
-    Normalizes encoding and visibility enums in one place.
-    """
-    # Normalize enums here - callers don't need to
-    normalized_encoding = _normalize_encoding(encoding)
-    normalized_visibility = _normalize_visibility(visibility)
-
-    payload: Dict[str, Any] = {
-        "value": value,
-        "contentType": content_type,
-        "encoding": normalized_encoding.value,
-        "visibility": normalized_visibility.value,
-        "source": ClipboardSource.SDK.value,
-    }
-
-    if name:
-        payload["name"] = name
-    if created_by_tool:
-        payload["createdByTool"] = created_by_tool
-    if created_by_model:
-        payload["createdByModel"] = created_by_model
-    if ttl_seconds is not None:
-        if ttl_seconds <= 0:
-            raise ValueError("ttl_seconds must be greater than 0 when provided")
-        payload["ttlSeconds"] = ttl_seconds
-
-    return payload
-
-
-def _parse_list_response(data: Dict[str, Any]) -> List[ClipboardEntry]:
-    """Parse list response and raise on failure."""
-    if not data.get("success"):
-        raise PluggedInError(data.get("error", "Failed to list clipboard entries"))
-    return ClipboardListResponse(**data).entries
-
-
-def _parse_entry_response(
-    data: Dict[str, Any],
-    error_msg: str = "Operation failed",
-    raise_on_failure: bool = True,
-) -> Optional[ClipboardEntry]:
-    """Parse entry response with consistent error handling.
-
-    Args:
-        data: API response data
-        error_msg: Error message to use if raising
-        raise_on_failure: If True, raises PluggedInError on failure.
-                         If False, returns None on failure.
-
-    Returns:
-        ClipboardEntry on success, None on failure (if not raising)
-
-    Raises:
-        PluggedInError: If raise_on_failure is True and operation failed
-    """
-    if not data.get("success"):
-        if raise_on_failure:
-            raise PluggedInError(data.get("error", error_msg))
-        return None
-
-    if "entry" in data and data["entry"]:
-        return ClipboardEntry(**data["entry"])
-
-    if raise_on_failure:
-        raise PluggedInError(data.get("error", error_msg))
-    return None
+_BASE_PATH = "/api/clipboard"
+_PUSH_PATH = "/api/clipboard/push"
+_POP_PATH = "/api/clipboard/pop"
+_PUSH_BATCH_PATH = "/api/clipboard/push/batch"
+_DELETE_BATCH_PATH = "/api/clipboard/batch"
 
+# Key for the bulk clear request, which shares its path with single deletes
+_CLEAR_ALL_BULK = "clearAll"
 
-def _parse_delete_response(data: Dict[str, Any]) -> int:
-    """Parse delete response and return deleted count.
+# Status codes meaning the server has no batch/bulk endpoint; callers fall back
+# to one request per item and stop trying that bulk operation
+_BATCH_UNSUPPORTED_STATUS = frozenset({404, 405})
 
-    Returns:
-        Number of deleted entries (0 if failed)
-    """
-    if not data.get("success"):
-        return 0
-    deleted = data.get("deleted", 0)
-    return int(deleted) if deleted is not None else 0
-
-
-def _build_get_params(filters: ClipboardGetFilters) -> Dict[str, str]:
-    """Build query params from validated filters."""
-    params: Dict[str, str] = {}
-    if filters.name is not None:
-        params["name"] = filters.name
-    if filters.idx is not None:
-        params["idx"] = str(filters.idx)
-    return params
+# Shared request body for clear_all. client.request() only serializes the json
+# argument, so a single module-level instance is safe; never mutate it.
+_CLEAR_ALL_PAYLOAD: Dict[str, Any] = {"clearAll": True}
 
+# Default cap on concurrent per-entry deletes when AsyncClipboardService.clear_all
+# falls back after a partial bulk delete
+_CLEAR_ALL_FALLBACK_CONCURRENCY = 16
 
-def _build_delete_payload(request: ClipboardDeleteRequest) -> Dict[str, Any]:
-    """Build delete payload from validated request."""
-    payload: Dict[str, Any] = {}
-    if request.name is not None:
-        payload["name"] = request.name
-    if request.idx is not None:
-        payload["idx"] = request.idx
-    return payload
-
+# (method, path, request kwargs) for a single API call
+_Request = Tuple[str, str, Dict[str, Any]]
 
 # -----------------------------------------------------------------------------
 # Result Types
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class ClearAllResult:
     """Result of clear_all operation with structured feedback.
 
@@ -169,19 +82,138 @@ class ClearAllResult:
         deleted: Number of successfully deleted entries
         failed: Number of entries that failed to delete
         total: Total entries attempted (deleted + failed)
+        success: True if all entries were deleted
     """
     deleted: int
     failed: int
+    total: int = field(init=False)
+    success: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Derived once at construction; frozen instances cannot go stale
+        object.__setattr__(self, "total", self.deleted + self.failed)
+        object.__setattr__(self, "success", self.failed == 0)
+
+
+# -----------------------------------------------------------------------------
+# Shared Request Building
+# -----------------------------------------------------------------------------
+
+
+class _ClipboardOps:
+    """Request building and response handling shared by both clipboard services.
+
+    Each ``_prepare_*`` method returns the ``(method, path, kwargs)`` of one API
+    call, so the sync and async services only differ in how they send it.
+    """
+
+    _batch_unsupported: Set[str]
+    _get_cache: Optional[TTLCache[ClipboardEntry]]
+    # Bumped by every write, so a get() that overlapped one does not cache
+    # what it read
+    _generation: int
+
+    def enable_cache(self, ttl: float = 1.0, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Cache get() results in memory for ``ttl`` seconds.
+
+        Any write sent through this service (set, push, pop, delete, ...)
+        clears the cache, so only changes made by other clients can go unseen,
+        for at most ``ttl`` seconds. Cached entries are shared between callers
+        and should be treated as read-only.
+
+        Args:
+            ttl: Seconds a cached entry stays valid (default: 1.0)
+            maxsize: Most entries kept, least recently used evicted first
+
+        Raises:
+            ValueError: If ttl is <= 0 or maxsize is < 1
+        """
+        self._get_cache = TTLCache(ttl, maxsize)
+
+    def disable_cache(self) -> None:
+        """Stop caching get() results and drop any cached entries."""
+        self._get_cache = None
+
+    def cache_clear(self) -> None:
+        """Drop cached get() results, forcing the next get() to hit the API."""
+        if self._get_cache is not None:
+            self._get_cache.clear()
+
+    @staticmethod
+    def _prepare_list() -> _Request:
+        return "GET", _BASE_PATH, {}
+
+    @staticmethod
+    def _prepare_get(name: Optional[str], idx: Optional[int]) -> _Request:
+        return "GET", _BASE_PATH, {"params": build_get_params(name, idx)}
+
+    @staticmethod
+    def _prepare_set(payload: Dict[str, Any]) -> _Request:
+        return "POST", _BASE_PATH, {"json": payload}
+
+    @staticmethod
+    def _prepare_push(payload: Dict[str, Any]) -> _Request:
+        return "POST", _PUSH_PATH, {"json": payload}
 
-    @property
-    def total(self) -> int:
-        """Total entries attempted."""
-        return self.deleted + self.failed
+    @staticmethod
+    def _prepare_pop() -> _Request:
+        return "POST", _POP_PATH, {}
 
-    @property
-    def success(self) -> bool:
-        """True if all entries were deleted."""
-        return self.failed == 0
+    @staticmethod
+    def _prepare_delete(payload: Dict[str, Any]) -> _Request:
+        return "DELETE", _BASE_PATH, {"json": payload}
+
+    @staticmethod
+    def _prepare_clear_all() -> _Request:
+        return "DELETE", _BASE_PATH, {"json": _CLEAR_ALL_PAYLOAD}
+
+    @staticmethod
+    def _prepare_batch(method: str, path: str, payloads: List[Dict[str, Any]]) -> _Request:
+        return method, path, {"json": {"entries": payloads}}
+
+    @staticmethod
+    def _delete_payloads(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [build_delete_payload(item.get("name"), item.get("idx")) for item in items]
+
+    @staticmethod
+    def _parse_clear_all(data: Dict[str, Any]) -> Tuple[int, bool]:
+        """Return the deleted count and whether the bulk delete was partial."""
+        if not data.get("success"):
+            raise PluggedInError(data.get("error", "Failed to clear clipboard"))
+        return data.get("deleted", 0), bool(data.get("partial"))
+
+    @staticmethod
+    def _fallback_result(deleted: int, attempted: int) -> ClearAllResult:
+        return ClearAllResult(deleted=deleted, failed=max(attempted - deleted, 0))
+
+    def _invalidate_after(self, method: str) -> None:
+        # Every request other than a GET may change entries, including one
+        # that failed after the server applied it
+        if method != "GET":
+            self._generation += 1
+            if self._get_cache is not None:
+                self._get_cache.clear()
+
+    def _cache_entry(
+        self, key: Tuple[Optional[str], Optional[int]], entry: ClipboardEntry, generation: int
+    ) -> None:
+        """Cache a get() result unless a write was made since the read began."""
+        cache = self._get_cache
+        if cache is None or self._generation != generation:
+            return
+        cache.set(key, entry)
+        # A write that raced with set() may have cleared the cache just before
+        if self._generation != generation:
+            cache.pop(key)
+
+    def _batch_supported(self, key: str) -> bool:
+        return key not in self._batch_unsupported
+
+    def _reject_batch(self, key: str, error: PluggedInError) -> None:
+        """Remember that the server lacks a bulk endpoint, or re-raise the error."""
+        if error.status_code not in _BATCH_UNSUPPORTED_STATUS:
+            raise error
+        self._batch_unsupported.add(key)
 
 
 # -----------------------------------------------------------------------------
@@ -189,7 +221,7 @@ class ClearAllResult:
 # -----------------------------------------------------------------------------
 
 
-class ClipboardService:
+class ClipboardService(_ClipboardOps):
     """Synchronous clipboard service for Plugged.in.
 
     Provides persistent key-value and stack-based storage for AI workflows.
@@ -197,6 +229,9 @@ class ClipboardService:
 
     def __init__(self, client: "PluggedInClient"):
         self.client = client
+        self._batch_unsupported: Set[str] = set()
+        self._get_cache = None
+        self._generation = 0
 
     def list(self) -> List[ClipboardEntry]:
         """List all clipboard entries.
@@ -207,8 +242,26 @@ class ClipboardService:
         Raises:
             PluggedInError: If the API request fails
         """
-        response = self.client.request("GET", "/api/clipboard")
-        return _parse_list_response(response.json())
+        return parse_list_bytes(self._call_bytes(self._prepare_list()))
+
+    def iter_entries(self) -> Iterator[ClipboardEntry]:
+        """Iterate over all clipboard entries, validating each one on demand.
+
+        Cheaper than list() when the caller stops early; list() is faster
+        when every entry is consumed. With ijson installed
+        (``pluggedinkit[stream]``) the body is parsed as it downloads, so only
+        one raw entry is held in memory at a time and the request is sent on
+        first iteration.
+
+        Returns:
+            Iterator of ClipboardEntry objects
+
+        Raises:
+            PluggedInError: If the API request fails
+        """
+        if can_stream():
+            return self._stream_entries()
+        return iter_list_response(self._call(self._prepare_list()))
 
     def get(
         self,
@@ -227,16 +280,22 @@ class ClipboardService:
         Raises:
             ValueError: If neither name nor idx is provided
         """
-        # Use Pydantic model for validation
-        filters = ClipboardGetFilters(name=name, idx=idx)
-        params = _build_get_params(filters)
-
-        response = self.client.request("GET", "/api/clipboard", params=params)
-        return _parse_entry_response(
-            response.json(),
+        key = (name, idx)
+        cache = self._get_cache
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry
+
+        generation = self._generation
+        entry = parse_entry_bytes(
+            self._call_bytes(self._prepare_get(name, idx)),
             error_msg="Failed to get clipboard entry",
             raise_on_failure=False,
         )
+        if entry is not None:
+            self._cache_entry(key, entry, generation)
+        return entry
 
     def set(
         self,
@@ -268,26 +327,19 @@ class ClipboardService:
             PluggedInError: If the API request fails
             ValueError: If ttl_seconds is <= 0
         """
-        payload = _build_clipboard_payload(
-            value=value,
-            name=name,
-            content_type=content_type,
-            encoding=encoding,
-            visibility=visibility,
-            created_by_tool=created_by_tool,
-            created_by_model=created_by_model,
-            ttl_seconds=ttl_seconds,
+        payload = build_clipboard_payload(
+            value,
+            name,
+            content_type,
+            encoding,
+            visibility,
+            created_by_tool,
+            created_by_model,
+            ttl_seconds,
         )
-
-        response = self.client.request("POST", "/api/clipboard", json=payload)
-        result = _parse_entry_response(
-            response.json(),
-            error_msg="Failed to set clipboard entry",
-            raise_on_failure=True,
+        return unwrap_entry(
+            self._call_bytes(self._prepare_set(payload)), "Failed to set clipboard entry"
         )
-        # result is guaranteed non-None when raise_on_failure=True
-        assert result is not None
-        return result
 
     def push(
         self,
@@ -317,24 +369,36 @@ class ClipboardService:
             PluggedInError: If the API request fails
             ValueError: If ttl_seconds is <= 0
         """
-        payload = _build_clipboard_payload(
-            value=value,
-            content_type=content_type,
-            encoding=encoding,
-            visibility=visibility,
-            created_by_tool=created_by_tool,
-            created_by_model=created_by_model,
-            ttl_seconds=ttl_seconds,
+        payload = build_clipboard_payload(
+            value,
+            None,
+            content_type,
+            encoding,
+            visibility,
+            created_by_tool,
+            created_by_model,
+            ttl_seconds,
         )
+        return self._push_payload(payload)
 
-        response = self.client.request("POST", "/api/clipboard/push", json=payload)
-        result = _parse_entry_response(
-            response.json(),
-            error_msg="Failed to push to clipboard",
-            raise_on_failure=True,
-        )
-        assert result is not None
-        return result
+    def push_many(self, items: List[Dict[str, Any]]) -> List[ClipboardEntry]:
+        """Push several values to the indexed clipboard in one request.
+
+        Falls back to one push request per item if the server has no batch
+        endpoint.
+
+        Args:
+            items: One dict of push() keyword arguments per value,
+                   e.g. ``{"value": "...", "ttl_seconds": 60}``
+
+        Returns:
+            The created ClipboardEntry objects, in the order given
+
+        Raises:
+            PluggedInError: If the API request fails
+            ValueError: If any ttl_seconds is <= 0
+        """
+        return self._push_payloads([build_clipboard_payload(**item) for item in items])
 
     def pop(self) -> Optional[ClipboardEntry]:
         """Pop the last indexed entry from clipboard (LIFO).
@@ -342,9 +406,8 @@ class ClipboardService:
         Returns:
             The popped ClipboardEntry, or None if clipboard is empty
         """
-        response = self.client.request("POST", "/api/clipboard/pop")
-        return _parse_entry_response(
-            response.json(),
+        return parse_entry_bytes(
+            self._call_bytes(self._prepare_pop()),
             error_msg="Failed to pop from clipboard",
             raise_on_failure=False,
         )
@@ -366,34 +429,121 @@ class ClipboardService:
         Raises:
             ValueError: If neither name nor idx is provided
         """
-        # Use Pydantic model for validation
-        request = ClipboardDeleteRequest(name=name, idx=idx)
-        payload = _build_delete_payload(request)
+        return self._delete_payload(build_delete_payload(name, idx))
+
+    def delete_many(self, items: List[Dict[str, Any]]) -> int:
+        """Delete several clipboard entries in one request.
+
+        Falls back to one delete request per item if the server has no batch
+        endpoint.
+
+        Args:
+            items: One dict per entry with a ``name`` and/or ``idx`` key
+
+        Returns:
+            Number of deleted entries
+
+        Raises:
+            ValueError: If an item has neither name nor idx
+        """
+        payloads = self._delete_payloads(items)
+        if not payloads:
+            return 0
 
-        response = self.client.request("DELETE", "/api/clipboard", json=payload)
-        return _parse_delete_response(response.json())
+        content = self._call_batch("DELETE", _DELETE_BATCH_PATH, payloads)
+        if content is not None:
+            return parse_delete_response(loads(content))
+        return sum(self._delete_payload(payload) for payload in payloads)
 
     def clear_all(self) -> ClearAllResult:
         """Clear all clipboard entries using bulk delete API.
 
+        If the server reports a partial bulk delete, or has no bulk delete
+        at all, the remaining entries are listed and deleted individually
+        (one by one); entries that still cannot be deleted are counted in
+        ``failed``.
+
         Returns:
             ClearAllResult with deleted count and status
 
         Raises:
             PluggedInError: If the API request fails
         """
-        response = self.client.request(
-            "DELETE",
-            "/api/clipboard",
-            json={"clearAll": True}
+        deleted = 0
+        content = self._call_bulk(_CLEAR_ALL_BULK, self._prepare_clear_all())
+        if content is not None:
+            deleted, partial = self._parse_clear_all(loads(content))
+            if not partial:
+                return ClearAllResult(deleted=deleted, failed=0)
+
+        entries = self.list()
+        if not entries:
+            return ClearAllResult(deleted=deleted, failed=0)
+        remaining = self._clear_all_fallback(entries)
+        return ClearAllResult(deleted=deleted + remaining.deleted, failed=remaining.failed)
+
+    def _call(self, request: _Request) -> Any:
+        method, path, kwargs = request
+        try:
+            return response_json(self.client.request(method, path, **kwargs))
+        finally:
+            self._invalidate_after(method)
+
+    def _call_bytes(self, request: _Request) -> bytes:
+        method, path, kwargs = request
+        try:
+            return self.client.request(method, path, **kwargs).content
+        finally:
+            self._invalidate_after(method)
+
+    def _stream_entries(self) -> Iterator[ClipboardEntry]:
+        method, path, kwargs = self._prepare_list()
+        response = self.client.request(method, path, stream=True, **kwargs)
+        try:
+            yield from iter_list_stream(response.iter_bytes())
+        finally:
+            response.close()
+
+    def _call_bulk(self, key: str, request: _Request) -> Optional[bytes]:
+        """Send a bulk request, or return None if the server lacks the endpoint."""
+        if not self._batch_supported(key):
+            return None
+        try:
+            return self._call_bytes(request)
+        except PluggedInError as e:
+            self._reject_batch(key, e)
+            return None
+
+    def _call_batch(
+        self, method: str, path: str, payloads: List[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        return self._call_bulk(path, self._prepare_batch(method, path, payloads))
+
+    def _push_payload(self, payload: Dict[str, Any]) -> ClipboardEntry:
+        return unwrap_entry(
+            self._call_bytes(self._prepare_push(payload)), "Failed to push to clipboard"
         )
-        data = response.json()
 
-        if not data.get("success"):
-            raise PluggedInError(data.get("error", "Failed to clear clipboard"))
+    def _push_payloads(self, payloads: List[Dict[str, Any]]) -> List[ClipboardEntry]:
+        if not payloads:
+            return []
+
+        content = self._call_batch("POST", _PUSH_BATCH_PATH, payloads)
+        if content is not None:
+            return parse_list_bytes(content, error_msg="Failed to push to clipboard")
+
+        # Sequential so entries are indexed in the order given
+        return [self._push_payload(payload) for payload in payloads]
 
-        deleted = data.get("deleted", 0)
-        return ClearAllResult(deleted=deleted, failed=0)
+    def _delete_payload(self, payload: Dict[str, Any]) -> int:
+        return parse_delete_response(self._call(self._prepare_delete(payload)))
+
+    def _clear_all_fallback(self, entries: List[ClipboardEntry]) -> ClearAllResult:
+        deleted = 0
+        for entry in entries:
+            with contextlib.suppress(PluggedInError, ValueError):
+                deleted += self._delete_payload(build_delete_payload(entry.name, entry.idx))
+        return self._fallback_result(deleted, len(entries))
 
 
 # -----------------------------------------------------------------------------
@@ -401,7 +551,7 @@ class ClipboardService:
 # -----------------------------------------------------------------------------
 
 
-class AsyncClipboardService:
+class AsyncClipboardService(_ClipboardOps):
     """Asynchronous clipboard service for Plugged.in.
 
     Provides persistent key-value and stack-based storage for AI workflows.
@@ -409,6 +559,10 @@ class AsyncClipboardService:
 
     def __init__(self, client: "AsyncPluggedInClient"):
         self.client = client
+        self._batch_unsupported: Set[str] = set()
+        self._get_cache = None
+        self._generation = 0
+        self._push_batcher: Optional[AsyncBatcher[Dict[str, Any], ClipboardEntry]] = None
 
     async def list(self) -> List[ClipboardEntry]:
         """List all clipboard entries.
@@ -419,8 +573,39 @@ class AsyncClipboardService:
         Raises:
             PluggedInError: If the API request fails
         """
-        response = await self.client.request("GET", "/api/clipboard")
-        return _parse_list_response(response.json())
+        return parse_list_bytes(await self._call_bytes(self._prepare_list()))
+
+    async def iter_entries(self) -> AsyncIterator[ClipboardEntry]:
+        """Iterate over all clipboard entries, validating each one on demand.
+
+        Cheaper than list() when the caller stops early; list() is faster
+        when every entry is consumed. The request is sent on first iteration.
+        With ijson installed (``pluggedinkit[stream]``) the body is parsed as
+        it downloads, so only one raw entry is held in memory at a time.
+
+        Yields:
+            ClipboardEntry objects
+
+        Raises:
+            PluggedInError: If the API request fails
+        """
+        if not can_stream():
+            for entry in iter_list_response(await self._call(self._prepare_list())):
+                yield entry
+            return
+
+        method, path, kwargs = self._prepare_list()
+        response = await self.client.request(method, path, stream=True, **kwargs)
+        try:
+            parser = new_list_stream_parser()
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield ClipboardEntry.model_validate(item)
+            for item in parser.close():
+                yield ClipboardEntry.model_validate(item)
+            check_list_stream(parser)
+        finally:
+            await response.aclose()
 
     async def get(
         self,
@@ -439,15 +624,22 @@ class AsyncClipboardService:
         Raises:
             ValueError: If neither name nor idx is provided
         """
-        filters = ClipboardGetFilters(name=name, idx=idx)
-        params = _build_get_params(filters)
-
-        response = await self.client.request("GET", "/api/clipboard", params=params)
-        return _parse_entry_response(
-            response.json(),
+        key = (name, idx)
+        cache = self._get_cache
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry
+
+        generation = self._generation
+        entry = parse_entry_bytes(
+            await self._call_bytes(self._prepare_get(name, idx)),
             error_msg="Failed to get clipboard entry",
             raise_on_failure=False,
         )
+        if entry is not None:
+            self._cache_entry(key, entry, generation)
+        return entry
 
     async def set(
         self,
@@ -479,25 +671,19 @@ class AsyncClipboardService:
             PluggedInError: If the API request fails
             ValueError: If ttl_seconds is <= 0
         """
-        payload = _build_clipboard_payload(
-            value=value,
-            name=name,
-            content_type=content_type,
-            encoding=encoding,
-            visibility=visibility,
-            created_by_tool=created_by_tool,
-            created_by_model=created_by_model,
-            ttl_seconds=ttl_seconds,
+        payload = build_clipboard_payload(
+            value,
+            name,
+            content_type,
+            encoding,
+            visibility,
+            created_by_tool,
+            created_by_model,
+            ttl_seconds,
         )
-
-        response = await self.client.request("POST", "/api/clipboard", json=payload)
-        result = _parse_entry_response(
-            response.json(),
-            error_msg="Failed to set clipboard entry",
-            raise_on_failure=True,
+        return unwrap_entry(
+            await self._call_bytes(self._prepare_set(payload)), "Failed to set clipboard entry"
         )
-        assert result is not None
-        return result
 
     async def push(
         self,
@@ -527,24 +713,85 @@ class AsyncClipboardService:
             PluggedInError: If the API request fails
             ValueError: If ttl_seconds is <= 0
         """
-        payload = _build_clipboard_payload(
-            value=value,
-            content_type=content_type,
-            encoding=encoding,
-            visibility=visibility,
-            created_by_tool=created_by_tool,
-            created_by_model=created_by_model,
-            ttl_seconds=ttl_seconds,
+        payload = build_clipboard_payload(
+            value,
+            None,
+            content_type,
+            encoding,
+            visibility,
+            created_by_tool,
+            created_by_model,
+            ttl_seconds,
         )
+        return await self._push_payload(payload)
+
+    async def push_many(self, items: List[Dict[str, Any]]) -> List[ClipboardEntry]:
+        """Push several values to the indexed clipboard in one request.
+
+        Falls back to one push request per item if the server has no batch
+        endpoint.
+
+        Args:
+            items: One dict of push() keyword arguments per value,
+                   e.g. ``{"value": "...", "ttl_seconds": 60}``
+
+        Returns:
+            The created ClipboardEntry objects, in the order given
+
+        Raises:
+            PluggedInError: If the API request fails
+            ValueError: If any ttl_seconds is <= 0
+        """
+        return await self._push_payloads([build_clipboard_payload(**item) for item in items])
+
+    async def push_coalesced(
+        self,
+        value: str,
+        content_type: str = "text/plain",
+        encoding: Union[ClipboardEncoding, str] = ClipboardEncoding.UTF8,
+        visibility: Union[ClipboardVisibility, str] = ClipboardVisibility.PRIVATE,
+        created_by_tool: Optional[str] = None,
+        created_by_model: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> ClipboardEntry:
+        """Push a value, sharing one batch request with concurrent callers.
 
-        response = await self.client.request("POST", "/api/clipboard/push", json=payload)
-        result = _parse_entry_response(
-            response.json(),
-            error_msg="Failed to push to clipboard",
-            raise_on_failure=True,
+        Pushes made within a few milliseconds of each other (up to 64) are
+        sent together in one batch request. Use this instead of push() when
+        many tasks push concurrently. If the server has no batch endpoint,
+        the values are pushed one by one and a failed push raises only in
+        its own caller.
+
+        Args:
+            value: Value to store
+            content_type: MIME type (default: text/plain)
+            encoding: Content encoding (default: utf-8)
+            visibility: Visibility level (default: private)
+            created_by_tool: Tool name for attribution
+            created_by_model: Model name for attribution
+            ttl_seconds: Time-to-live in seconds
+
+        Returns:
+            The created ClipboardEntry with assigned index
+
+        Raises:
+            PluggedInError: If the API request fails
+            ValueError: If ttl_seconds is <= 0
+        """
+        payload = build_clipboard_payload(
+            value,
+            None,
+            content_type,
+            encoding,
+            visibility,
+            created_by_tool,
+            created_by_model,
+            ttl_seconds,
         )
-        assert result is not None
-        return result
+
+        if self._push_batcher is None:
+            self._push_batcher = AsyncBatcher(self._push_coalesced_payloads)
+        return await self._push_batcher.submit(payload)
 
     async def pop(self) -> Optional[ClipboardEntry]:
         """Pop the last indexed entry from clipboard (LIFO).
@@ -552,9 +799,8 @@ class AsyncClipboardService:
         Returns:
             The popped ClipboardEntry, or None if clipboard is empty
         """
-        response = await self.client.request("POST", "/api/clipboard/pop")
-        return _parse_entry_response(
-            response.json(),
+        return parse_entry_bytes(
+            await self._call_bytes(self._prepare_pop()),
             error_msg="Failed to pop from clipboard",
             raise_on_failure=False,
         )
@@ -576,30 +822,157 @@ class AsyncClipboardService:
         Raises:
             ValueError: If neither name nor idx is provided
         """
-        request = ClipboardDeleteRequest(name=name, idx=idx)
-        payload = _build_delete_payload(request)
+        return await self._delete_payload(build_delete_payload(name, idx))
 
-        response = await self.client.request("DELETE", "/api/clipboard", json=payload)
-        return _parse_delete_response(response.json())
+    async def delete_many(self, items: List[Dict[str, Any]]) -> int:
+        """Delete several clipboard entries in one request.
 
-    async def clear_all(self) -> ClearAllResult:
+        Falls back to one delete request per item if the server has no batch
+        endpoint.
+
+        Args:
+            items: One dict per entry with a ``name`` and/or ``idx`` key
+
+        Returns:
+            Number of deleted entries
+
+        Raises:
+            ValueError: If an item has neither name nor idx
+        """
+        payloads = self._delete_payloads(items)
+        if not payloads:
+            return 0
+
+        content = await self._call_batch("DELETE", _DELETE_BATCH_PATH, payloads)
+        if content is not None:
+            return parse_delete_response(loads(content))
+
+        deleted = 0
+        for payload in payloads:
+            deleted += await self._delete_payload(payload)
+        return deleted
+
+    async def clear_all(
+        self, max_concurrency: int = _CLEAR_ALL_FALLBACK_CONCURRENCY
+    ) -> ClearAllResult:
         """Clear all clipboard entries using bulk delete API.
 
+        If the server reports a partial bulk delete, or has no bulk delete
+        at all, the remaining entries are listed and deleted individually and
+        concurrently; entries that still cannot be deleted are counted in
+        ``failed``.
+
+        Args:
+            max_concurrency: Most per-entry deletes in flight at once during
+                             the fallback (default: 16)
+
         Returns:
             ClearAllResult with deleted count and status
 
         Raises:
             PluggedInError: If the API request fails
+            ValueError: If max_concurrency is < 1
         """
-        response = await self.client.request(
-            "DELETE",
-            "/api/clipboard",
-            json={"clearAll": True}
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        deleted = 0
+        content = await self._call_bulk(_CLEAR_ALL_BULK, self._prepare_clear_all())
+        if content is not None:
+            deleted, partial = self._parse_clear_all(loads(content))
+            if not partial:
+                return ClearAllResult(deleted=deleted, failed=0)
+
+        entries = await self.list()
+        if not entries:
+            return ClearAllResult(deleted=deleted, failed=0)
+        remaining = await self._clear_all_fallback(entries, max_concurrency)
+        return ClearAllResult(deleted=deleted + remaining.deleted, failed=remaining.failed)
+
+    async def _call(self, request: _Request) -> Any:
+        method, path, kwargs = request
+        try:
+            return response_json(await self.client.request(method, path, **kwargs))
+        finally:
+            self._invalidate_after(method)
+
+    async def _call_bytes(self, request: _Request) -> bytes:
+        method, path, kwargs = request
+        try:
+            return (await self.client.request(method, path, **kwargs)).content
+        finally:
+            self._invalidate_after(method)
+
+    async def _call_bulk(self, key: str, request: _Request) -> Optional[bytes]:
+        """Send a bulk request, or return None if the server lacks the endpoint."""
+        if not self._batch_supported(key):
+            return None
+        try:
+            return await self._call_bytes(request)
+        except PluggedInError as e:
+            self._reject_batch(key, e)
+            return None
+
+    async def _call_batch(
+        self, method: str, path: str, payloads: List[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        return await self._call_bulk(path, self._prepare_batch(method, path, payloads))
+
+    async def _push_payload(self, payload: Dict[str, Any]) -> ClipboardEntry:
+        return unwrap_entry(
+            await self._call_bytes(self._prepare_push(payload)), "Failed to push to clipboard"
         )
-        data = response.json()
 
-        if not data.get("success"):
-            raise PluggedInError(data.get("error", "Failed to clear clipboard"))
+    async def _push_payloads(self, payloads: List[Dict[str, Any]]) -> List[ClipboardEntry]:
+        if not payloads:
+            return []
+
+        content = await self._call_batch("POST", _PUSH_BATCH_PATH, payloads)
+        if content is not None:
+            return parse_list_bytes(content, error_msg="Failed to push to clipboard")
 
-        deleted = data.get("deleted", 0)
-        return ClearAllResult(deleted=deleted, failed=0)
+        # Sequential so entries are indexed in the order given
+        return [await self._push_payload(payload) for payload in payloads]
+
+    async def _push_coalesced_payloads(
+        self, payloads: List[Dict[str, Any]]
+    ) -> Sequence[Union[ClipboardEntry, Exception]]:
+        """Batch function for push_coalesced(), with one result per caller.
+
+        Without a batch endpoint a failed push is returned in place of its
+        entry, so it fails only its own caller rather than the whole batch.
+        """
+        content = await self._call_batch("POST", _PUSH_BATCH_PATH, payloads)
+        if content is not None:
+            return parse_list_bytes(content, error_msg="Failed to push to clipboard")
+
+        results: List[Union[ClipboardEntry, Exception]] = []
+        for payload in payloads:
+            try:
+                results.append(await self._push_payload(payload))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def _delete_payload(self, payload: Dict[str, Any]) -> int:
+        return parse_delete_response(await self._call(self._prepare_delete(payload)))
+
+    async def _clear_all_fallback(
+        self, entries: List[ClipboardEntry], max_concurrency: int
+    ) -> ClearAllResult:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def delete_entry(entry: ClipboardEntry) -> int:
+            async with semaphore:
+                return await self._delete_payload(build_delete_payload(entry.name, entry.idx))
+
+        results = await asyncio.gather(
+            *(delete_entry(entry) for entry in entries), return_exceptions=True
+        )
+        deleted = 0
+        for result in results:
+            if isinstance(result, int):
+                deleted += result
+            elif not isinstance(result, (PluggedInError, ValueError)):
+                raise result
+        return self._fallback_result(deleted, len(entries))
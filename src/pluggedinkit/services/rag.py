@@ -1,30 +1,249 @@
 """RAG service for Plugged.in SDK"""
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
-
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .._batching import AsyncBatcher
+from .._cache import (
+    DEFAULT_MAXSIZE,
+    DEFAULT_SEMANTIC_CAPACITY,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    SemanticCache,
+    TTLCache,
+)
+from .._json import FieldStreamParser, can_stream, response_json
 from ..exceptions import PluggedInError
 from ..types import RagResponse, RagSourceDocument, RagStorageStats
+from ._rag_helpers import build_query_body, parse_rag_response, transform_rag_response
 
 if TYPE_CHECKING:
+    import httpx
+
     from ..client import AsyncPluggedInClient, PluggedInClient
 
+DEFAULT_ANSWER_CACHE_TTL = 60.0  # seconds
+AVAILABILITY_TTL = 30.0  # seconds
+STORAGE_STATS_TTL = 15.0  # seconds
+
+_QUERY_PATH = "/api/rag/query"
+_QUERY_BATCH_PATH = "/api/rag/query/batch"
+_HEALTH_PATH = "/api/rag/health"
+_HEALTH_CHECK_QUERY = "__pluggedin_health_check__"
+# Statuses meaning the server lacks an optional endpoint (batch, health)
+_UNSUPPORTED_STATUS = frozenset({404, 405})
+
+_Availability = Dict[str, Union[bool, Optional[str]]]
+# (query, include_metadata, limit)
+_AnswerKey = Tuple[str, bool, Optional[int]]
+
+# Top-level fields read from a streamed query response; "" is a bare string body
+_STREAM_FIELDS = ("answer", "response", "results", "message", "success", "error", "")
+_NO_ANSWER = "No answer received from knowledge base"
+
+
+def _is_text_response(response: "httpx.Response") -> bool:
+    content_type: str = response.headers.get("content-type", "")
+    return content_type.startswith("text/")
+
+
+def _check_limit(limit: Optional[int]) -> None:
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be None or >= 0")
+
+
+def _early_answer(fields: Dict[str, Any]) -> Optional[str]:
+    """Return the answer if it is settled before the end of the body.
+
+    "answer" takes precedence over the other answer fields, so it is final as
+    soon as it is parsed.
+    """
+    answer = fields.get("answer")
+    if answer and isinstance(answer, str) and fields.get("success") is not False:
+        return answer
+    return None
+
+
+def _final_answer(fields: Dict[str, Any]) -> str:
+    """Return the answer from a complete response, or raise if there is none"""
+    if fields.get("success") is not False:
+        answer = (
+            fields.get("answer")
+            or fields.get("response")
+            or fields.get("results")
+            or fields.get("message")
+            or fields.get("")
+        )
+        if answer and isinstance(answer, str):
+            return answer
+    raise PluggedInError(fields.get("error") or _NO_ANSWER)
+
+
+class _RagCache:
+    """Caching state shared by both RAG services"""
+
+    _answer_cache: Optional[TTLCache[RagResponse]]
+    # One similarity cache per include_metadata flag, so answers without
+    # documents are never served to callers that asked for them
+    _semantic_caches: Optional[Dict[bool, SemanticCache[RagResponse]]]
+    # (expiry time, result) of the last availability check
+    _availability: Optional[Tuple[float, _Availability]]
+    _health_supported: bool
+
+    def enable_cache(
+        self, ttl: float = DEFAULT_ANSWER_CACHE_TTL, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        """Cache successful query() results in memory for ``ttl`` seconds.
+
+        Repeating a query with the same text, include_metadata flag and limit
+        within ttl returns the cached response without a request, so documents added
+        or removed in the meantime are not reflected until it expires. Cached
+        responses are shared between callers and should be treated as
+        read-only.
+
+        Args:
+            ttl: Seconds a cached answer stays valid (default: 60)
+            maxsize: Most answers kept, least recently used evicted first
+
+        Raises:
+            ValueError: If ttl is <= 0 or maxsize is < 1
+        """
+        self._answer_cache = TTLCache(ttl, maxsize)
+
+    def enable_semantic_cache(
+        self,
+        embed_fn: Callable[[str], Any],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        capacity: int = DEFAULT_SEMANTIC_CAPACITY,
+        ttl: Optional[float] = DEFAULT_ANSWER_CACHE_TTL,
+    ) -> None:
+        """Serve query() from earlier answers to similar questions.
+
+        Each query is embedded with ``embed_fn`` and compared (cosine
+        similarity) with previously answered queries; a match scoring at
+        least ``threshold`` returns the earlier response without a request.
+        Requires numpy (``pip install pluggedinkit[semantic]``). embed_fn is
+        called synchronously on every query, including from the async
+        service, so it should be a local model rather than a network call.
+        Checked after the exact-match cache when both are enabled; queries
+        with a limit only use the exact-match cache.
+
+        Args:
+            embed_fn: Maps a query string to a 1-D vector of floats
+            threshold: Minimum cosine similarity for a hit (default: 0.95)
+            capacity: Most answers kept, oldest overwritten first
+            ttl: Seconds an answer stays valid, or None to keep it until
+                 overwritten (default: 60)
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If threshold, capacity or ttl is out of range
+        """
+        self._semantic_caches = {
+            flag: SemanticCache(embed_fn, threshold, capacity, ttl) for flag in (True, False)
+        }
 
-class RagService:
+    def disable_cache(self) -> None:
+        """Stop caching query() results and drop any cached answers"""
+        self._answer_cache = None
+        self._semantic_caches = None
+
+    def cache_clear(self) -> None:
+        """Drop cached answers, forcing the next query() to hit the API"""
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
+        if self._semantic_caches is not None:
+            for cache in self._semantic_caches.values():
+                cache.clear()
+
+    def _cached_answer(self, key: _AnswerKey) -> Tuple[Optional[RagResponse], Any]:
+        """Return a cached response (or None) and the query embedding, if computed"""
+        if self._answer_cache is not None:
+            response = self._answer_cache.get(key)
+            if response is not None:
+                return response, None
+        if self._semantic_caches is None or key[2] is not None:
+            return None, None
+        return self._semantic_caches[key[1]].lookup(key[0])
+
+    def _store_answer(self, key: _AnswerKey, response: RagResponse, vector: Any) -> None:
+        if not response.success:
+            return
+        if self._answer_cache is not None:
+            self._answer_cache.set(key, response)
+        if vector is not None and self._semantic_caches is not None:
+            self._semantic_caches[key[1]].add(vector, response)
+
+    def _cached_availability(self) -> Optional[_Availability]:
+        cached = self._availability
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        # Copies, so callers cannot modify the cached result
+        return dict(cached[1])
+
+    def _store_availability(self, result: _Availability) -> _Availability:
+        self._availability = (time.monotonic() + AVAILABILITY_TTL, result)
+        return dict(result)
+
+    def _reject_health(self, error: PluggedInError) -> None:
+        """Remember that the server lacks a health endpoint, or re-raise the error."""
+        if error.status_code not in _UNSUPPORTED_STATUS:
+            raise error
+        self._health_supported = False
+
+
+class RagService(_RagCache):
     """Synchronous RAG service"""
 
     def __init__(self, client: "PluggedInClient"):
         self.client = client
+        self._answer_cache = None
+        self._semantic_caches = None
+        self._availability = None
+        self._health_supported = True
+        self._stats_cache: TTLCache[RagStorageStats] = TTLCache(STORAGE_STATS_TTL)
 
-    def query(self, query: str, include_metadata: bool = True) -> RagResponse:
-        """Query the knowledge base with a natural language question"""
-        payload = {
-            "query": query,
-            "includeMetadata": include_metadata,
-        }
-
-        response = self.client.request("POST", "/api/rag/query", json=payload)
-        data = self._parse_rag_response(response)
-        return self._transform_rag_response(data)
+    def query(
+        self,
+        query: str,
+        include_metadata: bool = True,
+        limit: Optional[int] = None,
+    ) -> RagResponse:
+        """Query the knowledge base with a natural language question
+
+        With ``limit``, the server is asked for at most that many source
+        documents and ``documents`` holds no more than ``limit`` entries.
+
+        Raises:
+            ValueError: If limit is negative
+        """
+        _check_limit(limit)
+        key = (query, include_metadata, limit)
+        response, vector = self._cached_answer(key)
+        if response is None:
+            response = self._query(query, include_metadata, limit)
+            self._store_answer(key, response, vector)
+        return response
+
+    def _query(
+        self, query: str, include_metadata: bool, limit: Optional[int] = None
+    ) -> RagResponse:
+        """Send a query to the API, bypassing the answer cache"""
+        body = build_query_body(query, include_metadata, limit)
+        response = self.client.request("POST", _QUERY_PATH, content=body)
+        data = parse_rag_response(response)
+        return transform_rag_response(data, limit)
 
     def ask_question(self, query: str) -> str:
         """Query knowledge base and get only the answer text"""
@@ -37,6 +256,52 @@ class RagService:
 
         return response.answer
 
+    def stream_query(self, query: str) -> Iterator[str]:
+        """Query the knowledge base and yield the answer as it downloads.
+
+        A plain-text answer is yielded chunk by chunk as it arrives. A JSON
+        answer is yielded in one piece as soon as it has been parsed, before
+        the rest of the body is read; this needs ijson
+        (``pluggedinkit[stream]``), and without it the whole body is read
+        first. The request is sent on first iteration and bypasses the answer
+        cache.
+
+        Raises:
+            PluggedInError: If the request fails or no answer is received
+        """
+        body = build_query_body(query, include_metadata=False)
+        response = self.client.request("POST", _QUERY_PATH, content=body, stream=True)
+        try:
+            if _is_text_response(response):
+                received = False
+                for text in response.iter_text():
+                    if text:
+                        received = True
+                        yield text
+                if not received:
+                    raise PluggedInError(_NO_ANSWER)
+                return
+
+            if not can_stream():
+                response.read()
+                data = parse_rag_response(response)
+                yield _final_answer(data if isinstance(data, dict) else {"": data})
+                return
+
+            parser = FieldStreamParser(_STREAM_FIELDS)
+            answer = None
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                if answer is None:
+                    answer = _early_answer(parser.fields)
+                    if answer is not None:
+                        yield answer
+            parser.close()
+            if answer is None:
+                yield _final_answer(parser.fields)
+        finally:
+            response.close()
+
     def query_with_sources(self, query: str) -> Dict[str, Union[str, List[RagSourceDocument]]]:
         """Query knowledge base and get answer with source documents"""
         response = self.query(query, include_metadata=True)
@@ -57,38 +322,67 @@ class RagService:
         limit: int = 5,
     ) -> List[RagSourceDocument]:
         """Get relevant documents for a query without generating an answer"""
-        response = self.query(query, include_metadata=True)
+        response = self.query(query, include_metadata=True, limit=limit)
 
         if not response.success:
             raise PluggedInError(response.error or "Failed to search documents")
 
-        documents = response.documents or []
-        return documents[:limit]
+        return response.documents or []
+
+    def check_availability(self, refresh: bool = False) -> _Availability:
+        """Check if RAG is available and configured
 
-    def check_availability(self) -> Dict[str, Union[bool, Optional[str]]]:
-        """Check if RAG is available and configured"""
+        The result is reused for 30 seconds; pass refresh=True to probe again.
+        """
+        if not refresh:
+            cached = self._cached_availability()
+            if cached is not None:
+                return cached
+
+        result: _Availability
         try:
-            self.query("__pluggedin_health_check__", include_metadata=False)
-            return {"available": True}
+            self._probe_availability()
+            result = {"available": True}
         except Exception as exc:  # pragma: no cover - best effort
-            return {
+            result = {
                 "available": False,
                 "message": str(exc),
             }
-
-    def get_storage_stats(self, user_id: str) -> RagStorageStats:
-        """Get RAG storage statistics for the authenticated user"""
+        return self._store_availability(result)
+
+    def _probe_availability(self) -> None:
+        """Reach the server, preferring its lightweight health endpoint"""
+        if self._health_supported:
+            try:
+                self.client.request("GET", _HEALTH_PATH)
+                return
+            except PluggedInError as e:
+                self._reject_health(e)
+        # Bypasses the answer cache so every check reaches the server
+        self._query(_HEALTH_CHECK_QUERY, include_metadata=False)
+
+    def get_storage_stats(self, user_id: str, refresh: bool = False) -> RagStorageStats:
+        """Get RAG storage statistics for the authenticated user
+
+        The result is reused per user for 15 seconds; pass refresh=True to
+        fetch it again.
+        """
         if not user_id:
             raise PluggedInError("user_id is required to fetch storage statistics")
 
+        if not refresh:
+            cached = self._stats_cache.get(user_id)
+            if cached is not None:
+                return cached
+
         response = self.client.request(
             "GET",
             "/api/rag/storage-stats",
             params={"user_id": user_id},
         )
-        data = response.json()
+        data = response_json(response)
 
-        return RagStorageStats(
+        stats = RagStorageStats(
             documents_count=data.get("documents_count", 0),
             total_chunks=data.get("total_chunks", 0),
             estimated_storage_mb=data.get("estimated_storage_mb", 0.0),
@@ -96,6 +390,8 @@ class RagService:
             embedding_dimension=data.get("embedding_dimension"),
             is_estimate=data.get("is_estimate", True),
         )
+        self._stats_cache.set(user_id, stats)
+        return stats
 
     def refresh_document(self, *args, **kwargs) -> None:
         """Legacy refresh flow is no longer exposed via the public API."""
@@ -109,75 +405,101 @@ class RagService:
             "Document removal is no longer available via the public API."
         )
 
-    def _parse_rag_response(self, response) -> Union[str, Dict]:
-        """Best-effort parsing for RAG responses that may return text or JSON."""
-        try:
-            return response.json()
-        except ValueError:
-            return response.text
-
-    def _transform_rag_response(self, data: Union[str, Dict]) -> RagResponse:
-        """Transform API response to RagResponse type"""
-        if isinstance(data, str):
-            return RagResponse(
-                success=True,
-                answer=data,
-                sources=[],
-                document_ids=[],
-                documents=[],
-            )
-
-        if not isinstance(data, dict):
-            return RagResponse(
-                success=False,
-                error="Unexpected response format from RAG query endpoint",
-            )
 
-        answer = (
-            data.get("answer")
-            or data.get("response")
-            or data.get("results")
-            or data.get("message")
-            or ""
-        )
-
-        sources = data.get("sources") or []
-        document_ids = data.get("documentIds") or data.get("document_ids") or []
-
-        documents = [
-            RagSourceDocument(
-                id=document_id,
-                name=sources[index] if index < len(sources) else f"Document {index + 1}",
-            )
-            for index, document_id in enumerate(document_ids)
-        ]
-
-        return RagResponse(
-            success=data.get("success", True),
-            answer=answer,
-            sources=sources,
-            document_ids=document_ids,
-            documents=documents,
-            error=data.get("error"),
-        )
-
-
-class AsyncRagService:
+class AsyncRagService(_RagCache):
     """Asynchronous RAG service"""
 
     def __init__(self, client: "AsyncPluggedInClient"):
         self.client = client
-
-    async def query(self, query: str, include_metadata: bool = True) -> RagResponse:
-        """Query the knowledge base with a natural language question"""
-        payload = {
-            "query": query,
-            "includeMetadata": include_metadata,
-        }
-
-        response = await self.client.request("POST", "/api/rag/query", json=payload)
-        data = self._parse_rag_response(response)
-        return self._transform_rag_response(data)
+        self._answer_cache = None
+        self._semantic_caches = None
+        self._availability = None
+        self._health_supported = True
+        self._stats_cache: TTLCache[RagStorageStats] = TTLCache(STORAGE_STATS_TTL)
+        self._batch_supported = True
+        self._query_batcher: Optional[AsyncBatcher[Tuple[str, bool], RagResponse]] = None
+        # Background availability check started by warmup()
+        self.health: Optional[asyncio.Task[_Availability]] = None
+        # In-flight storage stats requests, shared by concurrent callers
+        self._stats_requests: Dict[str, asyncio.Future[RagStorageStats]] = {}
+
+    async def query(
+        self,
+        query: str,
+        include_metadata: bool = True,
+        limit: Optional[int] = None,
+    ) -> RagResponse:
+        """Query the knowledge base with a natural language question
+
+        With ``limit``, the server is asked for at most that many source
+        documents and ``documents`` holds no more than ``limit`` entries.
+
+        Raises:
+            ValueError: If limit is negative
+        """
+        _check_limit(limit)
+        key = (query, include_metadata, limit)
+        response, vector = self._cached_answer(key)
+        if response is None:
+            response = await self._query(query, include_metadata, limit)
+            self._store_answer(key, response, vector)
+        return response
+
+    async def query_coalesced(self, query: str, include_metadata: bool = True) -> RagResponse:
+        """Query the knowledge base, sharing one request with concurrent callers.
+
+        Queries made within a few milliseconds of each other (up to 64) are
+        sent together in a single batch request, or concurrently one by one
+        if the server has no batch endpoint. Use this instead of query() when
+        many tasks query at once, e.g. under asyncio.gather().
+        """
+        key = (query, include_metadata, None)
+        response, vector = self._cached_answer(key)
+        if response is None:
+            if self._query_batcher is None:
+                self._query_batcher = AsyncBatcher(self._query_batch)
+            response = await self._query_batcher.submit((query, include_metadata))
+            self._store_answer(key, response, vector)
+        return response
+
+    async def _query(
+        self, query: str, include_metadata: bool, limit: Optional[int] = None
+    ) -> RagResponse:
+        """Send a query to the API, bypassing the answer cache"""
+        body = build_query_body(query, include_metadata, limit)
+        response = await self.client.request("POST", _QUERY_PATH, content=body)
+        data = parse_rag_response(response)
+        return transform_rag_response(data, limit)
+
+    async def _query_batch(
+        self, items: List[Tuple[str, bool]]
+    ) -> List[Union[RagResponse, BaseException]]:
+        """Answer queries queued by query_coalesced(), in order"""
+        if len(items) > 1 and self._batch_supported:
+            payload = {
+                "queries": [
+                    {"query": query, "includeMetadata": include_metadata}
+                    for query, include_metadata in items
+                ]
+            }
+            try:
+                response = await self.client.request("POST", _QUERY_BATCH_PATH, json=payload)
+            except PluggedInError as e:
+                if e.status_code not in _UNSUPPORTED_STATUS:
+                    raise
+                self._batch_supported = False
+            else:
+                data = response_json(response)
+                if not data.get("success", True):
+                    raise PluggedInError(data.get("error", "Batch RAG query failed"))
+                return [transform_rag_response(item) for item in data.get("results") or []]
+
+        # One query, or no batch endpoint: send them individually, failing
+        # only the callers whose own query failed
+        return await asyncio.gather(
+            *(self._query(query, include_metadata) for query, include_metadata in items),
+            return_exceptions=True,
+        )
 
     async def ask_question(self, query: str) -> str:
         """Query knowledge base and get only the answer text"""
@@ -190,6 +512,52 @@ class AsyncRagService:
 
         return response.answer
 
+    async def stream_query(self, query: str) -> AsyncIterator[str]:
+        """Query the knowledge base and yield the answer as it downloads.
+
+        A plain-text answer is yielded chunk by chunk as it arrives. A JSON
+        answer is yielded in one piece as soon as it has been parsed, before
+        the rest of the body is read; this needs ijson
+        (``pluggedinkit[stream]``), and without it the whole body is read
+        first. The request is sent on first iteration and bypasses the answer
+        cache.
+
+        Raises:
+            PluggedInError: If the request fails or no answer is received
+        """
+        body = build_query_body(query, include_metadata=False)
+        response = await self.client.request("POST", _QUERY_PATH, content=body, stream=True)
+        try:
+            if _is_text_response(response):
+                received = False
+                async for text in response.aiter_text():
+                    if text:
+                        received = True
+                        yield text
+                if not received:
+                    raise PluggedInError(_NO_ANSWER)
+                return
+
+            if not can_stream():
+                await response.aread()
+                data = parse_rag_response(response)
+                yield _final_answer(data if isinstance(data, dict) else {"": data})
+                return
+
+            parser = FieldStreamParser(_STREAM_FIELDS)
+            answer = None
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                if answer is None:
+                    answer = _early_answer(parser.fields)
+                    if answer is not None:
+                        yield answer
+            parser.close()
+            if answer is None:
+                yield _final_answer(parser.fields)
+        finally:
+            await response.aclose()
+
     async def query_with_sources(
         self,
         query: str,
@@ -213,38 +581,89 @@ class AsyncRagService:
         limit: int = 5,
     ) -> List[RagSourceDocument]:
         """Get relevant documents for a query without generating an answer"""
-        response = await self.query(query, include_metadata=True)
+        response = await self.query(query, include_metadata=True, limit=limit)
 
         if not response.success:
             raise PluggedInError(response.error or "Failed to search documents")
 
-        documents = response.documents or []
-        return documents[:limit]
+        return response.documents or []
 
-    async def check_availability(self) -> Dict[str, Union[bool, Optional[str]]]:
-        """Check if RAG is available and configured"""
+    async def check_availability(self, refresh: bool = False) -> _Availability:
+        """Check if RAG is available and configured
+
+        The result is reused for 30 seconds; pass refresh=True to probe again.
+        """
+        if not refresh:
+            cached = self._cached_availability()
+            if cached is not None:
+                return cached
+
+        result: _Availability
         try:
-            await self.query("__pluggedin_health_check__", include_metadata=False)
-            return {"available": True}
+            await self._probe_availability()
+            result = {"available": True}
         except Exception as exc:  # pragma: no cover - best effort
-            return {
+            result = {
                 "available": False,
                 "message": str(exc),
             }
-
-    async def get_storage_stats(self, user_id: str) -> RagStorageStats:
-        """Get RAG storage statistics for the authenticated user"""
+        return self._store_availability(result)
+
+    def warmup(self) -> "asyncio.Task[_Availability]":
+        """Start check_availability() in the background and return its task.
+
+        Call it at startup to overlap the check, and the connection it opens
+        for later queries, with other initialization. The task is also kept
+        as ``health``; await it before the first query only when a confirmed
+        availability result is required. Must be called with an event loop
+        running.
+        """
+        task = asyncio.get_running_loop().create_task(self.check_availability())
+        self.health = task
+        return task
+
+    async def _probe_availability(self) -> None:
+        """Reach the server, preferring its lightweight health endpoint"""
+        if self._health_supported:
+            try:
+                await self.client.request("GET", _HEALTH_PATH)
+                return
+            except PluggedInError as e:
+                self._reject_health(e)
+        # Bypasses the answer cache so every check reaches the server
+        await self._query(_HEALTH_CHECK_QUERY, include_metadata=False)
+
+    async def get_storage_stats(self, user_id: str, refresh: bool = False) -> RagStorageStats:
+        """Get RAG storage statistics for the authenticated user
+
+        The result is reused per user for 15 seconds; pass refresh=True to
+        fetch it again. Concurrent calls for the same user share one request.
+        """
         if not user_id:
             raise PluggedInError("user_id is required to fetch storage statistics")
 
+        if not refresh:
+            cached = self._stats_cache.get(user_id)
+            if cached is not None:
+                return cached
+
+        request = self._stats_requests.get(user_id)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch_storage_stats(user_id))
+            self._stats_requests[user_id] = request
+            request.add_done_callback(lambda _: self._stats_requests.pop(user_id, None))
+        # Shielded so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(request)
+
+    async def _fetch_storage_stats(self, user_id: str) -> RagStorageStats:
         response = await self.client.request(
             "GET",
             "/api/rag/storage-stats",
             params={"user_id": user_id},
         )
-        data = response.json()
+        data = response_json(response)
 
-        return RagStorageStats(
+        stats = RagStorageStats(
             documents_count=data.get("documents_count", 0),
             total_chunks=data.get("total_chunks", 0),
             estimated_storage_mb=data.get("estimated_storage_mb", 0.0),
@@ -252,6 +671,8 @@ class AsyncRagService:
             embedding_dimension=data.get("embedding_dimension"),
             is_estimate=data.get("is_estimate", True),
         )
+        self._stats_cache.set(user_id, stats)
+        return stats
 
     async def refresh_document(self, *args, **kwargs) -> None:
         """Legacy refresh flow is no longer exposed via the public API."""
@@ -264,55 +685,3 @@ class AsyncRagService:
         raise PluggedInError(
             "Document removal is no longer available via the public API."
         )
-
-    def _parse_rag_response(self, response) -> Union[str, Dict]:
-        """Best-effort parsing for RAG responses that may return text or JSON."""
-        try:
-            return response.json()
-        except ValueError:
-            return response.text
-
-    def _transform_rag_response(self, data: Union[str, Dict]) -> RagResponse:
-        """Transform API response to RagResponse type"""
-        if isinstance(data, str):
-            return RagResponse(
-                success=True,
-                answer=data,
-                sources=[],
-                document_ids=[],
-                documents=[],
-            )
-
-        if not isinstance(data, dict):
-            return RagResponse(
-                success=False,
-                error="Unexpected response format from RAG query endpoint",
-            )
-
-        answer = (
-            data.get("answer")
-            or data.get("response")
-            or data.get("results")
-            or data.get("message")
-            or ""
-        )
-
-        sources = data.get("sources") or []
-        document_ids = data.get("documentIds") or data.get("document_ids") or []
-
-        documents = [
-            RagSourceDocument(
-                id=document_id,
-                name=sources[index] if index < len(sources) else f"Document {index + 1}",
-            )
-            for index, document_id in enumerate(document_ids)
-        ]
-
-        return RagResponse(
-            success=data.get("success", True),
-            answer=answer,
-            sources=sources,
-            document_ids=document_ids,
-            documents=documents,
-            error=data.get("error"),
-        )
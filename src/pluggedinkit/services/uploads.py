@@ -3,6 +3,9 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Union
 
+import pydantic
+
+from .._json import response_json
 from ..exceptions import PluggedInError
 from ..types import DocumentWithContent, UploadMetadata, UploadResponse
 
@@ -10,6 +13,22 @@ if TYPE_CHECKING:
     from ..client import AsyncPluggedInClient, PluggedInClient
 
 
+def _inline_document(data: Dict[str, Any]) -> Optional[DocumentWithContent]:
+    """Return the uploaded document if the upload response includes it in full.
+
+    Uploads ask for the document back (``returnContent``) to save a second
+    request; servers that ignore the flag leave it out, and the caller then
+    fetches it by id.
+    """
+    document = data.get("document")
+    if not isinstance(document, dict) or "content" not in document:
+        return None
+    try:
+        return DocumentWithContent.model_validate(document)
+    except pydantic.ValidationError:
+        return None
+
+
 class UploadService:
     """Synchronous upload service"""
 
@@ -42,14 +61,19 @@ class UploadService:
             "category": metadata.category,
             "format": metadata.format or "md",
             "metadata": metadata.metadata,
+            "returnContent": True,
         }
 
         response = self.client.request("POST", "/api/documents/ai", json=payload)
-        data = response.json()
+        data = response_json(response)
 
         if not data.get("success"):
             raise PluggedInError(data.get("error", "Failed to upload document"))
 
+        document = _inline_document(data)
+        if document is not None:
+            return document
+
         document_id = data.get("documentId")
         if not document_id:
             raise PluggedInError("Server did not return a document id")
@@ -59,8 +83,8 @@ class UploadService:
             f"/api/documents/{document_id}",
             params={"includeContent": "true"},
         )
-        document_data = document_response.json()
-        return DocumentWithContent(**document_data)
+        document_data = response_json(document_response)
+        return DocumentWithContent.model_validate(document_data)
 
     def upload_batch(
         self,
@@ -128,14 +152,19 @@ class AsyncUploadService:
             "category": metadata.category,
             "format": metadata.format or "md",
             "metadata": metadata.metadata,
+            "returnContent": True,
         }
 
         response = await self.client.request("POST", "/api/documents/ai", json=payload)
-        data = response.json()
+        data = response_json(response)
 
         if not data.get("success"):
             raise PluggedInError(data.get("error", "Failed to upload document"))
 
+        document = _inline_document(data)
+        if document is not None:
+            return document
+
         document_id = data.get("documentId")
         if not document_id:
             raise PluggedInError("Server did not return a document id")
@@ -145,8 +174,8 @@ class AsyncUploadService:
             f"/api/documents/{document_id}",
             params={"includeContent": "true"},
         )
-        document_data = document_response.json()
-        return DocumentWithContent(**document_data)
+        document_data = response_json(document_response)
+        return DocumentWithContent.model_validate(document_data)
 
     async def upload_batch(
         self,
@@ -0,0 +1,71 @@
+"""Shared fixtures: clients wired to an in-process httpx.MockTransport"""
+
+import json
+from typing import Any, Callable, List, Tuple, Union
+
+import httpx
+import pytest
+
+from pluggedinkit import AsyncPluggedInClient, PluggedInClient
+
+BASE_URL = "http://test"
+
+Route = Callable[[httpx.Request], Union[httpx.Response, Any]]
+
+
+class Recorder:
+    """Transport handler that records requests and answers them from a route.
+
+    The route returns an httpx.Response, or any other value to be sent as a
+    200 JSON body.
+    """
+
+    def __init__(self, route: Route):
+        self.route = route
+        self.calls: List[Tuple[str, str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        self.calls.append((request.method, request.url.path, body))
+        result = self.route(request)
+        if isinstance(result, httpx.Response):
+            return result
+        return httpx.Response(200, json=result)
+
+    @property
+    def paths(self) -> List[str]:
+        return [path for _, path, _ in self.calls]
+
+
+@pytest.fixture
+def make_client():
+    clients = []
+
+    def factory(route: Route) -> Tuple[PluggedInClient, Recorder]:
+        recorder = Recorder(route)
+        http = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(recorder))
+        client = PluggedInClient("test-key", base_url=BASE_URL, max_retries=1, http_client=http)
+        clients.append(http)
+        return client, recorder
+
+    yield factory
+    for http in clients:
+        http.close()
+
+
+@pytest.fixture
+async def make_async_client():
+    clients = []
+
+    def factory(route: Route) -> Tuple[AsyncPluggedInClient, Recorder]:
+        recorder = Recorder(route)
+        http = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(recorder))
+        client = AsyncPluggedInClient(
+            "test-key", base_url=BASE_URL, max_retries=1, http_client=http
+        )
+        clients.append(http)
+        return client, recorder
+
+    yield factory
+    for http in clients:
+        await http.aclose()
@@ -0,0 +1,306 @@
+"""Heartbeat batcher tests against a mock transport"""
+
+import asyncio
+import json
+import logging
+import math
+
+import httpx
+import pytest
+
+from pluggedinkit import (
+    AsyncHeartbeatBatcher,
+    AsyncPluggedInClient,
+    HeartbeatBatcher,
+    PluggedInError,
+)
+from pluggedinkit.services.agents import _heartbeat_body
+
+BASE_URL = "http://test"
+
+# Long enough that only explicit flushes send anything during a test
+SLOW_INTERVAL_MS = 60_000
+
+
+def _fail(request):
+    return httpx.Response(500, json={"error": "unavailable"})
+
+
+def test_sync_batcher_sends_latest_reading_per_agent(make_client):
+    client, recorder = make_client(lambda request: {"success": True})
+    batcher = HeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS)
+
+    batcher.submit("a1", "IDLE", 1.0, 10.0, 100.0, 1)
+    batcher.submit("a1", "IDLE", 2.0, 20.0, 200.0, 2)
+    batcher.submit("a2", "SLEEP", 3.0, 30.0, 300.0, 3)
+    batcher.close()
+
+    assert sorted(recorder.paths) == [
+        "/api/agents/a1/heartbeat",
+        "/api/agents/a1/metrics",
+        "/api/agents/a2/heartbeat",
+        "/api/agents/a2/metrics",
+    ]
+    bodies = {path: body for _, path, body in recorder.calls}
+    assert bodies["/api/agents/a1/heartbeat"] == {"mode": "IDLE", "uptime_seconds": 2.0}
+    assert bodies["/api/agents/a1/metrics"]["cpu_percent"] == 20.0
+    assert "cpu_percent" not in bodies["/api/agents/a2/heartbeat"]
+
+
+def test_sync_batcher_survives_raising_on_error(make_client, caplog):
+    client, recorder = make_client(_fail)
+    seen = []
+
+    def on_error(agent_id, error):
+        seen.append(agent_id)
+        raise RuntimeError("handler bug")
+
+    batcher = HeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS, on_error=on_error)
+    with caplog.at_level(logging.ERROR, logger="pluggedinkit.services.agents"):
+        batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+        batcher.flush()
+        batcher.submit("a1", "IDLE", 2.0, 1.0, 1.0, 1)
+        batcher.close()
+
+    assert len(recorder.calls) == 4
+    assert seen == ["a1"] * 4
+    assert "on_error handler failed" in caplog.text
+
+
+async def test_async_batcher_flushes_on_close(make_async_client):
+    client, recorder = make_async_client(lambda request: {"success": True})
+    batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS)
+
+    async with batcher:
+        batcher.submit("a1", "EMERGENCY", 1.0, 1.0, 1.0, 1)
+        batcher.submit("a2", "IDLE", 1.0, 1.0, 1.0, 1)
+        assert recorder.calls == []
+
+    assert sorted(recorder.paths) == [
+        "/api/agents/a1/heartbeat",
+        "/api/agents/a1/metrics",
+        "/api/agents/a2/heartbeat",
+        "/api/agents/a2/metrics",
+    ]
+
+
+async def test_async_batcher_flushes_when_batch_is_full(make_async_client):
+    client, recorder = make_async_client(lambda request: {"success": True})
+    batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS, max_batch=2)
+
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    batcher.submit("a2", "IDLE", 1.0, 1.0, 1.0, 1)
+    for _ in range(50):
+        if len(recorder.calls) == 4:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(recorder.calls) == 4
+    await batcher.close()
+    assert len(recorder.calls) == 4
+
+
+async def test_async_batcher_close_completes_inflight_flush():
+    sent = []
+    started = asyncio.Event()
+
+    async def handler(request):
+        started.set()
+        await asyncio.sleep(0.05)
+        sent.append(request.url.path)
+        return httpx.Response(200, json={"success": True})
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    ) as http:
+        client = AsyncPluggedInClient("test-key", base_url=BASE_URL, http_client=http)
+        batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=10)
+        for i in range(3):
+            batcher.submit(f"a{i}", "IDLE", 1.0, 1.0, 1.0, 1)
+
+        await started.wait()
+        await batcher.close()
+
+    assert len(sent) == 6
+
+
+async def test_async_batcher_reports_failures_to_on_error(make_async_client):
+    client, _ = make_async_client(_fail)
+    errors = []
+    batcher = AsyncHeartbeatBatcher(
+        client.agents,
+        interval_ms=SLOW_INTERVAL_MS,
+        on_error=lambda agent_id, error: errors.append((agent_id, type(error))),
+    )
+
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    await batcher.close()
+
+    assert errors == [("a1", PluggedInError)] * 2
+
+
+async def test_async_batcher_survives_raising_on_error(make_async_client):
+    client, recorder = make_async_client(_fail)
+    seen = []
+
+    def on_error(agent_id, error):
+        seen.append(agent_id)
+        raise RuntimeError("handler bug")
+
+    batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=10, on_error=on_error)
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    await asyncio.sleep(0.05)
+    batcher.submit("a1", "IDLE", 2.0, 1.0, 1.0, 1)
+    await asyncio.sleep(0.05)
+
+    assert batcher._task is not None and not batcher._task.done()
+    await batcher.close()
+    assert len(recorder.calls) == 4
+    assert seen == ["a1"] * 4
+
+
+def test_sync_batcher_rejects_submit_after_close(make_client):
+    client, recorder = make_client(lambda request: {"success": True})
+    batcher = HeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS)
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit("a2", "IDLE", 1.0, 1.0, 1.0, 1)
+    batcher.flush()
+    batcher.close()
+
+    assert sorted(recorder.paths) == ["/api/agents/a1/heartbeat", "/api/agents/a1/metrics"]
+
+
+async def test_async_batcher_rejects_submit_after_close(make_async_client):
+    client, recorder = make_async_client(lambda request: {"success": True})
+    batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=SLOW_INTERVAL_MS)
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    await batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit("a2", "IDLE", 1.0, 1.0, 1.0, 1)
+    await batcher.flush()
+    await batcher.close()
+
+    assert sorted(recorder.paths) == ["/api/agents/a1/heartbeat", "/api/agents/a1/metrics"]
+
+
+async def test_async_batcher_restarts_a_dead_flusher(make_async_client, caplog):
+    client, recorder = make_async_client(lambda request: {"success": True})
+    batcher = AsyncHeartbeatBatcher(client.agents, interval_ms=10)
+
+    async def broken_flush():
+        raise RuntimeError("flusher bug")
+
+    batcher.flush = broken_flush
+    batcher.submit("a1", "IDLE", 1.0, 1.0, 1.0, 1)
+    dead = batcher._task
+    await asyncio.sleep(0.05)
+    assert dead.done()
+
+    del batcher.flush
+    with caplog.at_level(logging.ERROR, logger="pluggedinkit.services.agents"):
+        batcher.submit("a1", "IDLE", 2.0, 1.0, 1.0, 1)
+    assert batcher._task is not dead
+    await asyncio.sleep(0.05)
+
+    assert sorted(recorder.paths) == ["/api/agents/a1/heartbeat", "/api/agents/a1/metrics"]
+    assert "flusher stopped" in caplog.text
+    await batcher.close()
+
+
+@pytest.mark.parametrize("mode", ["EMERGENCY", "IDLE", "SLEEP"])
+@pytest.mark.parametrize(
+    "uptime", [0, 42, 3.5, 0.1, 1e-7, -1, -2.5, 2**63, 10**30, 1.5e300, -1e300]
+)
+def test_heartbeat_template_matches_json_body(mode, uptime):
+    body = _heartbeat_body(mode, uptime)
+
+    decoded = json.loads(body["content"])
+    assert decoded == {"mode": mode, "uptime_seconds": uptime}
+    assert type(decoded["uptime_seconds"]) is type(uptime)
+
+
+@pytest.mark.parametrize("uptime", [math.inf, math.nan, True, "12"])
+def test_heartbeat_body_sends_other_uptimes_as_json(uptime):
+    assert _heartbeat_body("IDLE", uptime) == {"json": {"mode": "IDLE", "uptime_seconds": uptime}}
+
+
+def test_heartbeat_sends_template_body(make_client):
+    client, recorder = make_client(lambda request: {"success": True})
+
+    client.agents.heartbeat("a1", "SLEEP", 12.25)
+
+    assert recorder.calls == [
+        ("POST", "/api/agents/a1/heartbeat", {"mode": "SLEEP", "uptime_seconds": 12.25})
+    ]
+
+
+def _pages_route(params_seen):
+    """Serve three pages of agents linked by ``next_cursor``; the last has none."""
+    pages = {
+        None: {"items": [{"id": "a1"}, {"id": "a2"}], "next_cursor": "c2"},
+        "c2": {"items": [{"id": "a3"}], "next_cursor": "c3"},
+        "c3": {"items": [{"id": "a4"}]},
+    }
+
+    def route(request):
+        params_seen.append(dict(request.url.params))
+        return pages[request.url.params.get("cursor")]
+
+    return route
+
+
+def test_iter_list_follows_cursors(make_client):
+    params = []
+    client, recorder = make_client(_pages_route(params))
+
+    agents = list(client.agents.iter_list(page_size=2))
+
+    assert [agent["id"] for agent in agents] == ["a1", "a2", "a3", "a4"]
+    assert recorder.paths == ["/api/agents"] * 3
+    assert params == [
+        {"limit": "2"},
+        {"limit": "2", "cursor": "c2"},
+        {"limit": "2", "cursor": "c3"},
+    ]
+
+
+def test_iter_list_stops_early_without_fetching_more(make_client):
+    params = []
+    client, _ = make_client(_pages_route(params))
+
+    agents = client.agents.iter_list()
+    assert [next(agents)["id"], next(agents)["id"]] == ["a1", "a2"]
+
+    assert params == [{"limit": "100"}]
+
+
+@pytest.mark.parametrize(
+    "body", [{"items": [{"id": "a1"}]}, {"items": [{"id": "a1"}], "next_cursor": None}]
+)
+def test_iter_list_stops_without_next_cursor(make_client, body):
+    client, recorder = make_client(lambda request: body)
+
+    assert list(client.agents.iter_list()) == [{"id": "a1"}]
+    assert len(recorder.calls) == 1
+
+
+def test_iter_list_treats_plain_list_as_one_page(make_client):
+    client, recorder = make_client(lambda request: [{"id": "a1"}, {"id": "a2"}])
+
+    assert len(list(client.agents.iter_list())) == 2
+    assert len(recorder.calls) == 1
+
+
+async def test_async_iter_list_follows_cursors(make_async_client):
+    params = []
+    client, _ = make_async_client(_pages_route(params))
+
+    agents = [agent async for agent in client.agents.iter_list(page_size=5)]
+
+    assert [agent["id"] for agent in agents] == ["a1", "a2", "a3", "a4"]
+    assert [page["limit"] for page in params] == ["5"] * 3
+    assert [page.get("cursor") for page in params] == [None, "c2", "c3"]
@@ -0,0 +1,67 @@
+"""In-process cache tests"""
+
+import types
+
+import pytest
+
+import pluggedinkit._cache as cache_module
+from pluggedinkit._cache import SemanticCache
+
+pytest.importorskip("numpy")
+
+# Both stored texts are similar to the query; "old" is the closer match
+EMBEDDINGS = {
+    "old": [1.0, 0.0],
+    "new": [0.98, 0.2],
+    "query": [0.995, 0.1],
+}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _cache(ttl=None):
+    return SemanticCache(EMBEDDINGS.__getitem__, threshold=0.9, capacity=4, ttl=ttl)
+
+
+def test_semantic_cache_returns_best_match():
+    cache = _cache()
+    cache.set("old", "old answer")
+    cache.set("new", "new answer")
+
+    assert cache.get("query") == "old answer"
+
+
+def test_semantic_cache_skips_expired_best_match(clock):
+    cache = _cache(ttl=10)
+    cache.set("old", "old answer")
+    clock[0] = 8.0
+    cache.set("new", "new answer")
+
+    assert cache.get("query") == "old answer"
+    clock[0] = 12.0
+    assert cache.get("query") == "new answer"
+    # The expired row no longer holds on to its value
+    assert "old answer" not in cache._values
+
+
+def test_semantic_cache_misses_when_every_match_expired(clock):
+    cache = _cache(ttl=10)
+    cache.set("old", "old answer")
+    cache.set("new", "new answer")
+    clock[0] = 10.0
+
+    assert cache.get("query") is None
+
+
+def test_semantic_cache_reuses_expired_rows(clock):
+    cache = _cache(ttl=10)
+    cache.set("old", "old answer")
+    clock[0] = 20.0
+    cache.set("old", "fresh answer")
+
+    assert cache.get("query") == "fresh answer"
@@ -0,0 +1,73 @@
+"""Client construction and transport tests"""
+
+import httpx
+import pytest
+
+import pluggedinkit.client as client_module
+from pluggedinkit import AsyncPluggedInClient, PluggedInClient
+
+BASE_URL = "http://test"
+
+
+def _header_recorder(seen):
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"success": True, "entries": []})
+
+    return handler
+
+
+def test_caller_supplied_client_is_used_and_left_open():
+    seen = []
+    http = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(_header_recorder(seen)))
+
+    with PluggedInClient("key-1", base_url=BASE_URL, http_client=http) as client:
+        client.clipboard.list()
+        client.set_api_key("key-2")
+        client.clipboard.list()
+
+    assert seen == ["Bearer key-1", "Bearer key-2"]
+    assert not http.is_closed
+    http.close()
+
+
+def test_owned_client_is_closed():
+    client = PluggedInClient("key", base_url=BASE_URL)
+    client.close()
+
+    assert client.http.is_closed
+
+
+async def test_async_caller_supplied_client_is_used_and_left_open():
+    seen = []
+    http = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(_header_recorder(seen))
+    )
+
+    async with AsyncPluggedInClient("key-1", base_url=BASE_URL, http_client=http) as client:
+        await client.clipboard.list()
+        client.set_api_key("key-2")
+        await client.clipboard.list()
+
+    assert seen == ["Bearer key-1", "Bearer key-2"]
+    assert not http.is_closed
+    await http.aclose()
+
+
+@pytest.mark.parametrize("client_class", [PluggedInClient, AsyncPluggedInClient])
+def test_http2_is_opt_in(monkeypatch, client_class):
+    # Installing h2 (often pulled in by other packages) must not switch transports
+    monkeypatch.setattr(client_module, "is_available", lambda name: True)
+
+    client = client_class("key", base_url=BASE_URL)
+
+    assert client.http._transport._pool._http2 is False
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_http2_auto_follows_h2_availability(monkeypatch, installed):
+    monkeypatch.setattr(client_module, "is_available", lambda name: installed)
+
+    assert client_module.BaseClient._use_http2(None) is installed
+    assert client_module.BaseClient._use_http2(False) is False
+    assert client_module.BaseClient._use_http2(True) is True
@@ -0,0 +1,297 @@
+"""Clipboard service tests against a mock transport"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import pluggedinkit.services.clipboard as clipboard_module
+from pluggedinkit import ClearAllResult, PluggedInError
+
+ENTRY = {
+    "uuid": "u0",
+    "name": "key",
+    "idx": None,
+    "value": "v",
+    "contentType": "text/plain",
+    "encoding": "utf-8",
+    "sizeBytes": 1,
+    "visibility": "private",
+    "source": "sdk",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+}
+# One named entry and four indexed ones; deleting idx 2 fails with a server
+# error and idx 3 reports failure in the body
+ENTRIES = [ENTRY] + [dict(ENTRY, uuid=f"u{i}", name=None, idx=i) for i in range(4)]
+
+
+def _clipboard_route(bulk):
+    """Route serving the entries above, with ``bulk`` answering clear-all requests."""
+
+    def route(request):
+        if request.method == "GET":
+            return {"success": True, "entries": ENTRIES}
+        body = request.content
+        if b"clearAll" in body:
+            return bulk
+        if b'"idx":2' in body:
+            return httpx.Response(500, json={"error": "boom"})
+        if b'"idx":3' in body:
+            return {"success": False}
+        return {"success": True, "deleted": 1}
+
+    return route
+
+
+def _bulk_deletes(recorder):
+    return [body for _, _, body in recorder.calls if body == {"clearAll": True}]
+
+
+def test_clear_all_uses_bulk_delete(make_client):
+    client, recorder = make_client(_clipboard_route({"success": True, "deleted": 5}))
+
+    assert client.clipboard.clear_all() == ClearAllResult(deleted=5, failed=0)
+    assert len(recorder.calls) == 1
+
+
+def test_clear_all_finishes_partial_bulk_delete(make_client):
+    client, recorder = make_client(
+        _clipboard_route({"success": True, "deleted": 10, "partial": True})
+    )
+
+    result = client.clipboard.clear_all()
+
+    assert result == ClearAllResult(deleted=13, failed=2)
+    # bulk delete, list, then one delete per remaining entry
+    assert len(recorder.calls) == 2 + len(ENTRIES)
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_clear_all_falls_back_without_bulk_endpoint(make_client, status):
+    client, recorder = make_client(_clipboard_route(httpx.Response(status)))
+
+    first = client.clipboard.clear_all()
+    second = client.clipboard.clear_all()
+
+    assert first == second == ClearAllResult(deleted=3, failed=2)
+    # The missing endpoint is only probed once
+    assert len(_bulk_deletes(recorder)) == 1
+
+
+def test_clear_all_raises_other_bulk_errors(make_client):
+    client, _ = make_client(_clipboard_route(httpx.Response(500, json={"error": "down"})))
+
+    with pytest.raises(PluggedInError):
+        client.clipboard.clear_all()
+
+
+async def test_async_clear_all_falls_back_without_bulk_endpoint(make_async_client):
+    client, recorder = make_async_client(_clipboard_route(httpx.Response(405)))
+
+    result = await client.clipboard.clear_all()
+
+    assert result == ClearAllResult(deleted=3, failed=2)
+    assert len(_bulk_deletes(recorder)) == 1
+
+
+async def test_async_clear_all_finishes_partial_bulk_delete(make_async_client):
+    client, _ = make_async_client(
+        _clipboard_route({"success": True, "deleted": 10, "partial": True})
+    )
+
+    result = await client.clipboard.clear_all()
+
+    assert result == ClearAllResult(deleted=13, failed=2)
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_iter_entries(make_client, monkeypatch, stream):
+    monkeypatch.setattr(clipboard_module, "can_stream", lambda: stream)
+    client, _ = make_client(_clipboard_route(None))
+
+    entries = list(client.clipboard.iter_entries())
+
+    assert [entry.uuid for entry in entries] == [entry["uuid"] for entry in ENTRIES]
+
+
+@pytest.mark.parametrize("stream", [True, False])
+async def test_async_iter_entries(make_async_client, monkeypatch, stream):
+    monkeypatch.setattr(clipboard_module, "can_stream", lambda: stream)
+    client, _ = make_async_client(_clipboard_route(None))
+
+    entries = [entry async for entry in client.clipboard.iter_entries()]
+
+    assert [entry.uuid for entry in entries] == [entry["uuid"] for entry in ENTRIES]
+
+
+def test_iter_entries_stream_raises_on_failure(make_client, monkeypatch):
+    monkeypatch.setattr(clipboard_module, "can_stream", lambda: True)
+    client, _ = make_client(lambda request: {"success": False, "error": "nope"})
+
+    with pytest.raises(PluggedInError):
+        list(client.clipboard.iter_entries())
+
+
+def _entry_route(request):
+    if request.method == "GET":
+        return {"success": True, "entry": ENTRY}
+    return {"success": True, "entry": ENTRY, "deleted": 1}
+
+
+def test_cached_get_is_invalidated_by_writes(make_client):
+    client, recorder = make_client(_entry_route)
+    client.clipboard.enable_cache(ttl=60)
+
+    client.clipboard.get(name="key")
+    client.clipboard.get(name="key")
+    assert len(recorder.calls) == 1
+
+    client.clipboard.set("key", "new")
+    client.clipboard.get(name="key")
+    assert len(recorder.calls) == 3
+
+    client.clipboard.disable_cache()
+    client.clipboard.get(name="key")
+    assert len(recorder.calls) == 4
+
+
+def test_cached_get_is_invalidated_by_failed_write(make_client):
+    def route(request):
+        if request.method == "GET":
+            return {"success": True, "entry": ENTRY}
+        return httpx.Response(500, json={"error": "boom"})
+
+    client, recorder = make_client(route)
+    client.clipboard.enable_cache(ttl=60)
+    client.clipboard.get(name="key")
+    client.clipboard.get(name="key")
+    assert len(recorder.calls) == 1
+
+    # The write may have reached the server before failing
+    with pytest.raises(PluggedInError):
+        client.clipboard.set("key", "new")
+    client.clipboard.get(name="key")
+
+    assert len(recorder.calls) == 3
+
+
+def test_enable_cache_rejects_non_positive_ttl(make_client):
+    client, _ = make_client(_entry_route)
+
+    with pytest.raises(ValueError):
+        client.clipboard.enable_cache(ttl=0)
+
+
+async def test_async_cached_get_is_invalidated_by_writes(make_async_client):
+    client, recorder = make_async_client(_entry_route)
+    client.clipboard.enable_cache(ttl=60)
+
+    await client.clipboard.get(idx=1)
+    await client.clipboard.get(idx=1)
+    await client.clipboard.delete(idx=1)
+    await client.clipboard.get(idx=1)
+
+    assert len(recorder.calls) == 3
+
+
+def _batch_route(batch_status=200):
+    """Route for pushes and deletes; ``batch_status`` 404/405 hides the batch endpoints.
+
+    Single pushes of the value ``bad`` fail with a server error.
+    """
+    pushed = []
+
+    def pushed_entry(payload):
+        pushed.append(payload["value"])
+        index = len(pushed)
+        return dict(ENTRY, uuid=f"p{index}", name=None, idx=index, value=payload["value"])
+
+    def route(request):
+        path = request.url.path
+        body = json.loads(request.content)
+        if path.endswith("/batch"):
+            if batch_status != 200:
+                return httpx.Response(batch_status, json={"error": "not found"})
+            if request.method == "DELETE":
+                return {"success": True, "deleted": len(body["entries"])}
+            return {"success": True, "entries": [pushed_entry(p) for p in body["entries"]]}
+        if request.method == "DELETE":
+            return {"success": True, "deleted": 1}
+        if body["value"] == "bad":
+            return httpx.Response(500, json={"error": "boom"})
+        return {"success": True, "entry": pushed_entry(body)}
+
+    return route
+
+
+def test_push_many_uses_batch_endpoint(make_client):
+    client, recorder = make_client(_batch_route())
+
+    entries = client.clipboard.push_many([{"value": "a"}, {"value": "b", "ttl_seconds": 60}])
+
+    assert [entry.value for entry in entries] == ["a", "b"]
+    assert recorder.paths == ["/api/clipboard/push/batch"]
+    assert recorder.calls[0][2]["entries"][1]["ttlSeconds"] == 60
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_push_many_falls_back_without_batch_endpoint(make_client, status):
+    client, recorder = make_client(_batch_route(status))
+
+    first = client.clipboard.push_many([{"value": "a"}, {"value": "b"}])
+    second = client.clipboard.push_many([{"value": "c"}])
+
+    assert [entry.value for entry in first + second] == ["a", "b", "c"]
+    assert recorder.paths == ["/api/clipboard/push/batch"] + ["/api/clipboard/push"] * 3
+
+
+def test_push_many_fallback_raises_on_failed_push(make_client):
+    client, recorder = make_client(_batch_route(404))
+
+    with pytest.raises(PluggedInError):
+        client.clipboard.push_many([{"value": "a"}, {"value": "bad"}, {"value": "c"}])
+    # Later values are not pushed out of order
+    assert recorder.paths == ["/api/clipboard/push/batch"] + ["/api/clipboard/push"] * 2
+
+
+def test_delete_many_uses_batch_endpoint(make_client):
+    client, recorder = make_client(_batch_route())
+
+    assert client.clipboard.delete_many([{"name": "key"}, {"idx": 3}]) == 2
+    assert recorder.calls == [
+        ("DELETE", "/api/clipboard/batch", {"entries": [{"name": "key"}, {"idx": 3}]})
+    ]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+async def test_async_delete_many_falls_back_without_batch_endpoint(make_async_client, status):
+    client, recorder = make_async_client(_batch_route(status))
+
+    assert await client.clipboard.delete_many([{"name": "key"}, {"idx": 3}]) == 2
+    assert recorder.paths == ["/api/clipboard/batch"] + ["/api/clipboard"] * 2
+
+
+async def test_push_coalesced_shares_one_batch(make_async_client):
+    client, recorder = make_async_client(_batch_route())
+
+    entries = await asyncio.gather(*(client.clipboard.push_coalesced(v) for v in "abc"))
+
+    assert [entry.value for entry in entries] == ["a", "b", "c"]
+    assert recorder.paths == ["/api/clipboard/push/batch"]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+async def test_push_coalesced_fallback_fails_only_the_failed_caller(make_async_client, status):
+    client, recorder = make_async_client(_batch_route(status))
+
+    results = await asyncio.gather(
+        *(client.clipboard.push_coalesced(v) for v in ["a", "bad", "c"]),
+        return_exceptions=True,
+    )
+
+    assert results[0].value == "a"
+    assert isinstance(results[1], PluggedInError)
+    assert results[2].value == "c"
+    assert recorder.paths == ["/api/clipboard/push/batch"] + ["/api/clipboard/push"] * 3
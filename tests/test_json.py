@@ -0,0 +1,175 @@
+"""Tests for request body encoding and the incremental JSON parsers"""
+
+import json
+
+import httpx
+import pytest
+
+import pluggedinkit._json as json_module
+from pluggedinkit._json import FieldStreamParser, ListStreamParser, can_stream, dumps
+
+requires_ijson = pytest.mark.skipif(not can_stream(), reason="ijson is not installed")
+
+LIST_BODY = json.dumps(
+    {
+        "success": True,
+        "entries": [{"uuid": "u1", "tags": ["a", {"b": 1}]}, {"uuid": "u2", "size": 2.5}],
+        "error": None,
+    }
+).encode()
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@requires_ijson
+@pytest.mark.parametrize("size", [1, 7, len(LIST_BODY)])
+def test_list_parser_yields_items_across_chunks(size):
+    parser = ListStreamParser("entries")
+    items = []
+    for chunk in _chunks(LIST_BODY, size):
+        items += parser.feed(chunk)
+    items += parser.close()
+
+    assert items == [{"uuid": "u1", "tags": ["a", {"b": 1}]}, {"uuid": "u2", "size": 2.5}]
+    assert parser.success is True
+    assert parser.error is None
+
+
+@requires_ijson
+def test_list_parser_returns_items_as_they_complete():
+    parser = ListStreamParser("entries")
+    split = LIST_BODY.index(b'{"uuid": "u2"')
+
+    assert parser.feed(LIST_BODY[:split]) == [{"uuid": "u1", "tags": ["a", {"b": 1}]}]
+    assert parser.feed(LIST_BODY[split:]) == [{"uuid": "u2", "size": 2.5}]
+
+
+@requires_ijson
+def test_list_parser_reports_failure_fields():
+    parser = ListStreamParser("entries")
+    parser.feed(b'{"success": false, "error": "nope"}')
+    parser.close()
+
+    assert parser.success is False
+    assert parser.error == "nope"
+
+
+@requires_ijson
+def test_list_parser_raises_value_error_on_malformed_json():
+    parser = ListStreamParser("entries")
+
+    with pytest.raises(ValueError):
+        parser.feed(b'{"entries": [}')
+
+
+@requires_ijson
+def test_list_parser_raises_value_error_on_truncated_body():
+    parser = ListStreamParser("entries")
+    parser.feed(b'{"entries": [{"uuid": "u1"')
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@requires_ijson
+@pytest.mark.parametrize("size", [1, 5, 1000])
+def test_field_parser_collects_requested_scalars(size):
+    body = json.dumps(
+        {"answer": "yes", "sources": ["answer"], "nested": {"answer": "no"}, "success": True}
+    ).encode()
+    parser = FieldStreamParser(["answer", "success", "missing"])
+    for chunk in _chunks(body, size):
+        parser.feed(chunk)
+    parser.close()
+
+    assert parser.fields == {"answer": "yes", "success": True}
+
+
+@requires_ijson
+def test_field_parser_fills_fields_before_body_ends():
+    parser = FieldStreamParser(["answer"])
+    parser.feed(b'{"answer": "early", "sources": [')
+
+    assert parser.fields == {"answer": "early"}
+
+
+@requires_ijson
+def test_field_parser_matches_bare_scalar_with_empty_key():
+    parser = FieldStreamParser([""])
+    parser.feed(b'"just text"')
+    parser.close()
+
+    assert parser.fields == {"": "just text"}
+
+
+@requires_ijson
+def test_field_parser_raises_value_error_on_malformed_json():
+    parser = FieldStreamParser(["answer"])
+
+    with pytest.raises(ValueError):
+        parser.feed(b'{"answer": ]')
+
+
+@pytest.fixture(params=["msgspec", "orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Make dumps() use one encoder, skipping libraries that are not installed."""
+    name = request.param
+    if name != "stdlib":
+        pytest.importorskip(name)
+    monkeypatch.setattr(json_module, "is_available", lambda library: library == name)
+    return name
+
+
+def _httpx_body(payload):
+    return httpx.Request("POST", "http://test", json=payload).content
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"value": "naïve ☕ \"quoted\" \\ \x01", "contentType": "text/plain", "ttlSeconds": 60},
+        {"cpu_percent": 12.5, "memory_mb": 1024, "requests_handled": 0, "custom_metrics": None},
+        {"custom_metrics": {"ratio": 0.1, "big": 2**62, "flag": False, "tags": ["a", "b"]}},
+        {"entries": [{"name": "key"}, {"idx": 3}], "nested": {"empty": {}, "list": []}},
+        {"query": "q", "includeMetadata": True, "limit": 5},
+    ],
+)
+def test_dumps_matches_httpx_json_encoding(encoder, payload):
+    assert dumps(payload) == _httpx_body(payload)
+
+
+def test_dumps_converts_non_string_keys_like_the_stdlib(encoder):
+    payload = {"custom_metrics": {1: "int", 2.5: "float", None: "none", False: "bool"}}
+
+    assert dumps(payload) == _httpx_body(payload)
+    assert json.loads(dumps(payload)) == {
+        "custom_metrics": {"1": "int", "2.5": "float", "null": "none", "false": "bool"}
+    }
+
+
+def test_dumps_non_finite_floats(encoder):
+    payload = {"cpu_percent": float("nan"), "memory_mb": float("inf")}
+
+    if encoder == "stdlib":
+        with pytest.raises(ValueError):
+            dumps(payload)
+    else:
+        assert dumps(payload) == b'{"cpu_percent":null,"memory_mb":null}'
+
+
+def test_metrics_request_body_is_pinned(make_client, encoder):
+    bodies = []
+
+    def route(request):
+        bodies.append(request.content)
+        return {"success": True}
+
+    client, _ = make_client(route)
+    client.agents.metrics("a1", 12.5, 256, 3, {1: "x", "load": [0.5, 1]})
+
+    assert bodies == [
+        b'{"cpu_percent":12.5,"memory_mb":256,"requests_handled":3,'
+        b'"custom_metrics":{"1":"x","load":[0.5,1]}}'
+    ]
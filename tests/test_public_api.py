@@ -0,0 +1,72 @@
+"""Guards the names re-exported from the package root"""
+
+import pluggedinkit
+
+EXPECTED_ALL = {
+    # Clients
+    "PluggedInClient",
+    "AsyncPluggedInClient",
+    # Services
+    "AgentService",
+    "AsyncAgentService",
+    "HeartbeatBatcher",
+    "AsyncHeartbeatBatcher",
+    "ClearAllResult",
+    # Exceptions
+    "PluggedInError",
+    "AuthenticationError",
+    "NotFoundError",
+    "RateLimitError",
+    "ValidationError",
+    # Clipboard types
+    "ClipboardEntry",
+    "ClipboardSource",
+    "ClipboardEncoding",
+    "ClipboardVisibility",
+    "ClipboardSetRequest",
+    "ClipboardPushRequest",
+    "ClipboardGetFilters",
+    "ClipboardDeleteRequest",
+    "ClipboardListResponse",
+    "ClipboardResponse",
+    "ClipboardDeleteResponse",
+    "DEFAULT_CLIPBOARD_SOURCE",
+    # Document types
+    "Document",
+    "DocumentWithContent",
+    "DocumentFilters",
+    "DocumentListResponse",
+    "SearchResult",
+    "SearchResponse",
+    "UpdateDocumentRequest",
+    "AIMetadata",
+    "ModelInfo",
+    # RAG types
+    "RagResponse",
+    "RagSourceDocument",
+    "RagStorageStats",
+    # Upload types
+    "UploadMetadata",
+    "UploadResponse",
+    # Agent types
+    "Agent",
+    "AgentDetails",
+    "CreateAgentRequest",
+    "Heartbeat",
+    "LifecycleEvent",
+    "Metrics",
+    "ResourceRequirements",
+}
+
+
+def test_all_matches_golden_set():
+    assert set(pluggedinkit.__all__) == EXPECTED_ALL
+
+
+def test_all_has_no_duplicates():
+    assert len(pluggedinkit.__all__) == len(set(pluggedinkit.__all__))
+
+
+def test_every_exported_name_resolves():
+    for name in pluggedinkit.__all__:
+        assert getattr(pluggedinkit, name) is not None, name
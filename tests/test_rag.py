@@ -0,0 +1,331 @@
+"""RAG service tests against a mock transport"""
+
+import asyncio
+import json
+import types
+
+import httpx
+import pytest
+
+import pluggedinkit._cache as cache_module
+import pluggedinkit.services.rag as rag_module
+from pluggedinkit import PluggedInError
+from pluggedinkit.services._rag_helpers import build_query_body
+
+BODY = {
+    "success": True,
+    "answer": "the answer",
+    "sources": ["s1", "s2", "s3"],
+    "documentIds": ["d1", "d2", "d3", "d4"],
+}
+STATS = {"documents_count": 3, "total_chunks": 12, "estimated_storage_mb": 1.5}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    fake_time = types.SimpleNamespace(monotonic=lambda: now[0])
+    monkeypatch.setattr(cache_module, "time", fake_time)
+    monkeypatch.setattr(rag_module, "time", fake_time)
+    return now
+
+
+def _coalescing_route(batch_status):
+    """Answer batch queries with ``B:`` and single queries with ``S:`` answers.
+
+    The batch endpoint returns ``batch_status`` instead when it is not 200,
+    and the single query ``bad`` fails with a server error.
+    """
+
+    def route(request):
+        body = json.loads(request.content)
+        if request.url.path == "/api/rag/query/batch":
+            if batch_status != 200:
+                return httpx.Response(batch_status, json={"error": "not found"})
+            return {
+                "success": True,
+                "results": [
+                    {"success": True, "answer": "B:" + item["query"]} for item in body["queries"]
+                ],
+            }
+        if body["query"] == "bad":
+            return httpx.Response(500, json={"error": "boom"})
+        return {"success": True, "answer": "S:" + body["query"]}
+
+    return route
+
+
+async def test_query_coalesced_sends_one_batch(make_async_client):
+    client, recorder = make_async_client(_coalescing_route(200))
+
+    results = await asyncio.gather(*(client.rag.query_coalesced(q) for q in "abc"))
+
+    assert [result.answer for result in results] == ["B:a", "B:b", "B:c"]
+    assert recorder.paths == ["/api/rag/query/batch"]
+
+
+async def test_query_coalesced_single_query_skips_batch(make_async_client):
+    client, recorder = make_async_client(_coalescing_route(200))
+
+    result = await client.rag.query_coalesced("one")
+
+    assert result.answer == "S:one"
+    assert recorder.paths == ["/api/rag/query"]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+async def test_query_coalesced_falls_back_without_batch_endpoint(make_async_client, status):
+    client, recorder = make_async_client(_coalescing_route(status))
+
+    results = await asyncio.gather(
+        *(client.rag.query_coalesced(q) for q in ["a", "bad", "c"]),
+        return_exceptions=True,
+    )
+
+    assert results[0].answer == "S:a"
+    assert isinstance(results[1], PluggedInError)
+    assert results[2].answer == "S:c"
+    assert recorder.paths == ["/api/rag/query/batch"] + ["/api/rag/query"] * 3
+
+    # The missing endpoint is only probed once
+    await asyncio.gather(*(client.rag.query_coalesced(q) for q in "ac"))
+    assert recorder.paths.count("/api/rag/query/batch") == 1
+
+
+def test_query_limit_caps_documents(make_client):
+    client, recorder = make_client(lambda request: BODY)
+
+    result = client.rag.query("q", limit=2)
+
+    assert [document.id for document in result.documents] == ["d1", "d2"]
+    assert recorder.calls[-1][2]["limit"] == 2
+
+
+@pytest.mark.parametrize("limit", [-1, -10])
+def test_query_rejects_negative_limit(make_client, limit):
+    client, recorder = make_client(lambda request: BODY)
+
+    with pytest.raises(ValueError):
+        client.rag.query("q", limit=limit)
+    assert recorder.calls == []
+
+
+async def test_async_query_rejects_negative_limit(make_async_client):
+    client, recorder = make_async_client(lambda request: BODY)
+
+    with pytest.raises(ValueError):
+        await client.rag.query("q", limit=-1)
+    assert recorder.calls == []
+
+
+@pytest.mark.parametrize("stream", [True, False])
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        (httpx.Response(200, json=BODY), ["the answer"]),
+        (httpx.Response(200, json={"success": True, "message": "msg"}), ["msg"]),
+        (httpx.Response(200, json="bare"), ["bare"]),
+        (httpx.Response(200, text="plain text answer"), ["plain text answer"]),
+    ],
+)
+def test_stream_query(make_client, monkeypatch, stream, response, expected):
+    monkeypatch.setattr(rag_module, "can_stream", lambda: stream)
+    client, _ = make_client(lambda request: response)
+
+    assert list(client.rag.stream_query("q")) == expected
+
+
+@pytest.mark.parametrize("stream", [True, False])
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(200, json={"success": False, "answer": "x", "error": "bad"}),
+        httpx.Response(200, json={"success": True}),
+        httpx.Response(200, text=""),
+        httpx.Response(500, json={"error": "boom"}),
+    ],
+)
+def test_stream_query_raises_without_answer(make_client, monkeypatch, stream, response):
+    monkeypatch.setattr(rag_module, "can_stream", lambda: stream)
+    client, _ = make_client(lambda request: response)
+
+    with pytest.raises(PluggedInError):
+        list(client.rag.stream_query("q"))
+
+
+@pytest.mark.parametrize("stream", [True, False])
+async def test_async_stream_query(make_async_client, monkeypatch, stream):
+    monkeypatch.setattr(rag_module, "can_stream", lambda: stream)
+    client, _ = make_async_client(lambda request: BODY)
+
+    assert [text async for text in client.rag.stream_query("q")] == ["the answer"]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "plain ascii",
+        "",
+        "naïve café ☕",
+        'say "hi"',
+        "back\\slash",
+        "tab\there\nnewline\x00\x1f",
+        "\u2028separators\u2029",
+    ],
+)
+@pytest.mark.parametrize("include_metadata", [True, False])
+@pytest.mark.parametrize("limit", [None, 0, 5])
+def test_query_body_matches_json_dumps(query, include_metadata, limit):
+    payload = {"query": query, "includeMetadata": include_metadata}
+    if limit is not None:
+        payload["limit"] = limit
+
+    body = build_query_body(query, include_metadata, limit)
+
+    assert json.loads(body) == payload
+    assert body == json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize("include_metadata", [None, 0, 1, "yes"])
+def test_query_body_accepts_non_bool_include_metadata(include_metadata):
+    body = build_query_body("hi", include_metadata)
+
+    assert json.loads(body) == {"query": "hi", "includeMetadata": include_metadata}
+
+
+def _stats_route(statuses):
+    """Serve STATS, answering the n-th request with ``statuses[n]`` when given."""
+    seen = []
+
+    def route(request):
+        seen.append(request.url.params["user_id"])
+        status = statuses[len(seen) - 1] if len(seen) <= len(statuses) else 200
+        if status != 200:
+            return httpx.Response(status, json={"error": "down"})
+        return STATS
+
+    return route
+
+
+def test_storage_stats_are_cached_per_user(make_client, clock):
+    client, recorder = make_client(_stats_route([]))
+
+    first = client.rag.get_storage_stats("u1")
+    second = client.rag.get_storage_stats("u1")
+    client.rag.get_storage_stats("u2")
+
+    assert first == second
+    assert first.documents_count == 3
+    assert len(recorder.calls) == 2
+
+    clock[0] = rag_module.STORAGE_STATS_TTL
+    client.rag.get_storage_stats("u1")
+    assert len(recorder.calls) == 3
+
+
+def test_storage_stats_refresh_bypasses_cache(make_client, clock):
+    client, recorder = make_client(_stats_route([]))
+
+    client.rag.get_storage_stats("u1")
+    client.rag.get_storage_stats("u1", refresh=True)
+    client.rag.get_storage_stats("u1")
+
+    assert len(recorder.calls) == 2
+
+
+def test_storage_stats_failure_is_not_cached(make_client, clock):
+    client, recorder = make_client(_stats_route([500]))
+
+    with pytest.raises(PluggedInError):
+        client.rag.get_storage_stats("u1")
+
+    assert client.rag.get_storage_stats("u1").documents_count == 3
+    assert client.rag.get_storage_stats("u1").documents_count == 3
+    assert len(recorder.calls) == 2
+
+
+async def test_async_storage_stats_share_one_request(make_async_client, clock):
+    client, recorder = make_async_client(_stats_route([]))
+
+    results = await asyncio.gather(*(client.rag.get_storage_stats("u1") for _ in range(3)))
+
+    assert results[0] == results[1] == results[2]
+    assert len(recorder.calls) == 1
+    assert client.rag._stats_requests == {}
+
+    await client.rag.get_storage_stats("u1")
+    await client.rag.get_storage_stats("u1", refresh=True)
+    assert len(recorder.calls) == 2
+
+
+async def test_async_storage_stats_failure_is_shared_but_not_cached(make_async_client, clock):
+    client, recorder = make_async_client(_stats_route([500]))
+
+    results = await asyncio.gather(
+        *(client.rag.get_storage_stats("u1") for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, PluggedInError) for result in results)
+    assert len(recorder.calls) == 1
+
+    stats = await client.rag.get_storage_stats("u1")
+    assert stats.documents_count == 3
+    assert len(recorder.calls) == 2
+
+
+def _health_route(health_status):
+    """Answer the health endpoint with ``health_status`` and queries with BODY."""
+
+    def route(request):
+        if request.url.path == "/api/rag/health":
+            return httpx.Response(health_status, json={"ok": health_status == 200})
+        return BODY
+
+    return route
+
+
+def test_availability_uses_health_endpoint_and_caches(make_client, clock):
+    client, recorder = make_client(_health_route(200))
+
+    assert client.rag.check_availability() == {"available": True}
+    assert client.rag.check_availability() == {"available": True}
+    assert recorder.paths == ["/api/rag/health"]
+
+    client.rag.check_availability(refresh=True)
+    clock[0] = rag_module.AVAILABILITY_TTL
+    client.rag.check_availability()
+    assert recorder.paths == ["/api/rag/health"] * 3
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_availability_falls_back_to_query_without_health_endpoint(make_client, clock, status):
+    client, recorder = make_client(_health_route(status))
+
+    assert client.rag.check_availability() == {"available": True}
+    assert client.rag.check_availability(refresh=True) == {"available": True}
+
+    # The missing endpoint is only probed once
+    assert recorder.paths == ["/api/rag/health", "/api/rag/query", "/api/rag/query"]
+    assert recorder.calls[1][2]["query"] == rag_module._HEALTH_CHECK_QUERY
+
+
+def test_availability_reports_health_endpoint_errors(make_client, clock):
+    client, recorder = make_client(_health_route(500))
+
+    result = client.rag.check_availability()
+
+    assert result["available"] is False
+    assert result["message"]
+    assert recorder.paths == ["/api/rag/health"]
+
+
+async def test_async_availability_falls_back_to_query(make_async_client, clock):
+    client, recorder = make_async_client(_health_route(404))
+
+    assert await client.rag.check_availability() == {"available": True}
+    assert await client.rag.check_availability() == {"available": True}
+    assert recorder.paths == ["/api/rag/health", "/api/rag/query"]
+
+    clock[0] = rag_module.AVAILABILITY_TTL
+    await client.rag.check_availability()
+    assert recorder.paths == ["/api/rag/health", "/api/rag/query", "/api/rag/query"]
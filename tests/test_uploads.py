@@ -0,0 +1,88 @@
+"""Upload service tests against a mock transport"""
+
+import pytest
+
+from pluggedinkit import PluggedInError
+from pluggedinkit.types import UploadMetadata
+
+DOCUMENT = {
+    "id": "doc-1",
+    "title": "Notes",
+    "file_name": "notes.md",
+    "file_size": 5,
+    "mime_type": "text/markdown",
+    "source": "ai_generated",
+    "visibility": "private",
+    "version": 1,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "content": "hello",
+    "content_encoding": "utf-8",
+}
+METADATA = UploadMetadata(title="Notes")
+
+
+def _upload_route(upload_body):
+    """Answer the upload with ``upload_body`` and document fetches with DOCUMENT."""
+
+    def route(request):
+        if request.method == "POST":
+            return upload_body
+        return DOCUMENT
+
+    return route
+
+
+def test_upload_document_uses_inline_document(make_client):
+    client, recorder = make_client(_upload_route({"success": True, "document": DOCUMENT}))
+
+    document = client.uploads.upload_document("hello", METADATA)
+
+    assert document.id == "doc-1"
+    assert document.content == "hello"
+    assert recorder.paths == ["/api/documents/ai"]
+    assert recorder.calls[0][2]["returnContent"] is True
+
+
+@pytest.mark.parametrize(
+    "upload_body",
+    [
+        {"success": True, "documentId": "doc-1"},
+        # Present but without content, or not a valid document
+        {"success": True, "documentId": "doc-1", "document": {"id": "doc-1"}},
+        {"success": True, "documentId": "doc-1", "document": {"id": "doc-1", "content": "x"}},
+        {"success": True, "documentId": "doc-1", "document": "doc-1"},
+    ],
+)
+def test_upload_document_fetches_non_inline_document(make_client, upload_body):
+    client, recorder = make_client(_upload_route(upload_body))
+
+    document = client.uploads.upload_document("hello", METADATA)
+
+    assert document.id == "doc-1"
+    assert recorder.paths == ["/api/documents/ai", "/api/documents/doc-1"]
+
+
+def test_upload_document_requires_document_id(make_client):
+    client, _ = make_client(_upload_route({"success": True}))
+
+    with pytest.raises(PluggedInError):
+        client.uploads.upload_document("hello", METADATA)
+
+
+async def test_async_upload_document_uses_inline_document(make_async_client):
+    client, recorder = make_async_client(_upload_route({"success": True, "document": DOCUMENT}))
+
+    document = await client.uploads.upload_document("hello", METADATA)
+
+    assert document.content == "hello"
+    assert recorder.paths == ["/api/documents/ai"]
+
+
+async def test_async_upload_document_fetches_non_inline_document(make_async_client):
+    client, recorder = make_async_client(_upload_route({"success": True, "documentId": "doc-1"}))
+
+    document = await client.uploads.upload_document("hello", METADATA)
+
+    assert document.content == "hello"
+    assert recorder.paths == ["/api/documents/ai", "/api/documents/doc-1"]